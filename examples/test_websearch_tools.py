@@ -66,7 +66,6 @@ class WebSearchTestSuite:
         self.test_config = {
             "rate_limit_delay": 1.0,
             "max_retries": 2,
-            "exponential_backoff_base": 1.5,
             "max_backoff_delay": 10.0,
             "jitter_range": 0.1
         }
@@ -32,6 +32,13 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional, Set
 from collections import defaultdict, deque
 
+try:
+    from graphlib import CycleError, TopologicalSorter
+    GRAPHLIB_AVAILABLE = True
+except ImportError:
+    # Python 3.8: fall back to scanning for ready tasks
+    GRAPHLIB_AVAILABLE = False
+
 # Add workflown to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -52,6 +59,34 @@ from toolbox.webpage_parser import WebPageParserTool
 from toolbox.composer_tool import ComposerTool
 
 
+# Fixed per-type task parameters; the query-dependent parts are filled in per workflow
+_TASK_PARAMETER_TEMPLATES = {
+    "web_search": {
+        "max_results": 5,
+        "engine": "duckduckgo"
+    },
+    "webpage_parse": {
+        "strategy": "readability",
+        "extract_links": False,
+        "extract_images": False,
+        "max_content_length": 5000
+    },
+    "compose": {
+        "task": "summarize",
+        "content": "Sample content",  # Will be populated from scraping results
+        "format": "text",
+        "max_length": 2000,  # Increased from 1000 to 2000 for longer summaries
+        "min_length": 1000   # Added minimum length requirement
+    }
+}
+
+_COMPOSE_QUERY_TEMPLATE = (
+    "Provide a comprehensive summary of the following content about: {query}. "
+    "Include key points, main themes, and important details. "
+    "The summary should be detailed and informative."
+)
+
+
 class WorkflowExecutionEngine:
     """
     Generic workflow execution engine that handles:
@@ -73,8 +108,10 @@ class WorkflowExecutionEngine:
         self.running_tasks: Set[str] = set()
         self.failed_tasks: Set[str] = set()
         
-        # Task-to-tool mappings
+        # Task-to-tool mappings; one mapper serves every task so its logger
+        # and keyword index are set up once per engine
         self.task_mappings: Dict[str, TaskMapping] = {}
+        self.tool_mapper = ToolMapper(tool_registry)
         
         # Real-time display callback
         self.result_display_callback = None
@@ -137,27 +174,65 @@ class WorkflowExecutionEngine:
         for task in tasks.values():
             task.state = TaskState.PENDING
         
-        # Execute tasks until all are completed or failed
-        while len(self.completed_tasks) + len(self.failed_tasks) < len(tasks):
-            # Find ready tasks (dependencies satisfied)
-            ready_tasks = self._find_ready_tasks(tasks)
-            
-            if not ready_tasks and len(self.running_tasks) == 0:
-                # Deadlock or no more tasks can run
-                remaining = set(tasks.keys()) - self.completed_tasks - self.failed_tasks
-                raise Exception(f"Workflow deadlock: tasks {remaining} cannot start")
-            
-            # Execute ready tasks
-            for task_id in ready_tasks:
-                await self._execute_task(tasks[task_id])
-            
-            # Wait a bit for tasks to complete
-            if self.running_tasks:
-                await asyncio.sleep(0.1)
+        sorter = self._build_task_sorter(tasks) if GRAPHLIB_AVAILABLE else None
+        
+        in_flight: Dict[asyncio.Task, str] = {}
+        try:
+            while (
+                sorter.is_active() if sorter is not None
+                else len(self.completed_tasks) + len(self.failed_tasks) < len(tasks)
+            ):
+                # Find newly unblocked tasks
+                if sorter is not None:
+                    ready_tasks = sorter.get_ready()
+                else:
+                    ready_tasks = self._find_ready_tasks(tasks)
+                    if not ready_tasks and not in_flight:
+                        # Deadlock or no more tasks can run
+                        remaining = set(tasks.keys()) - self.completed_tasks - self.failed_tasks
+                        raise Exception(f"Workflow deadlock: tasks {remaining} cannot start")
+                
+                # Start every ready task; independent tasks run concurrently
+                for task_id in ready_tasks:
+                    in_flight[asyncio.create_task(self._execute_task(tasks[task_id]))] = task_id
+                
+                # Resume as soon as any task finishes instead of polling
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for run in done:
+                    task_id = in_flight.pop(run)
+                    run.result()  # Re-raise task failures
+                    if sorter is not None:
+                        sorter.done(task_id)
+        finally:
+            for run in in_flight:
+                run.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
         
         print(f"✅ Workflow execution completed: {len(self.completed_tasks)} successful, {len(self.failed_tasks)} failed")
         return self.task_results
     
+    def _build_task_sorter(self, tasks: Dict[str, Task]) -> "TopologicalSorter":
+        """Order tasks by their required dependencies; optional ones don't gate readiness."""
+        missing = {
+            dep.dependency_id
+            for task in tasks.values()
+            for dep in task.dependencies
+            if dep.required and dep.dependency_id not in tasks
+        }
+        if missing:
+            raise Exception(f"Workflow deadlock: dependencies {missing} are not in the workflow")
+        
+        sorter = TopologicalSorter({
+            task_id: {dep.dependency_id for dep in task.dependencies if dep.required}
+            for task_id, task in tasks.items()
+        })
+        try:
+            sorter.prepare()
+        except CycleError as e:
+            raise Exception(f"Workflow deadlock: tasks {set(e.args[1])} cannot start") from e
+        return sorter
+    
     def _find_ready_tasks(self, tasks: Dict[str, Task]) -> List[str]:
         """Find tasks that are ready to execute (dependencies satisfied)."""
         ready_tasks = []
@@ -290,14 +365,11 @@ class WorkflowExecutionEngine:
         
         # Get or create task mapping
         if task.task_id not in self.task_mappings:
-            # Create tool mapper
-            tool_mapper = ToolMapper(self.tool_registry)
-            
             print(f"🔧 Using registry instance: {id(self.tool_registry)}")
             print(f"🔧 Registry has {len(self.tool_registry._tool_classes)} tool classes")
             print(f"🔧 Registry task types: {list(self.tool_registry._task_type_index.keys())}")
             
-            mapping = tool_mapper.map_task_to_tool(
+            mapping = self.tool_mapper.map_task_to_tool(
                 task_id=task.task_id,
                 task_type=task.task_type,
                 task_description=task.description,
@@ -355,12 +427,15 @@ class WorkflowExecutionEngine:
     
     def get_execution_stats(self) -> Dict[str, Any]:
         """Get execution statistics."""
+        completed = len(self.completed_tasks)
+        failed = len(self.failed_tasks)
+        finished = completed + failed
         return {
-            "total_tasks": len(self.task_results) + len(self.failed_tasks),
-            "completed_tasks": len(self.completed_tasks),
-            "failed_tasks": len(self.failed_tasks),
+            "total_tasks": len(self.task_results) + failed,
+            "completed_tasks": completed,
+            "failed_tasks": failed,
             "running_tasks": len(self.running_tasks),
-            "success_rate": len(self.completed_tasks) / (len(self.completed_tasks) + len(self.failed_tasks)) if (len(self.completed_tasks) + len(self.failed_tasks)) > 0 else 0,
+            "success_rate": completed / finished if finished > 0 else 0,
             "tool_mappings": len(self.task_mappings)
         }
 
@@ -588,27 +663,14 @@ class GenericWorkflowExample(BaseWorkflow):
             
             # Set parameters based on task type
             if task_type == "web_search":
-                parameters = {
-                    "query": self.query,
-                    "max_results": 5,
-                    "engine": "duckduckgo"
-                }
+                parameters = {"query": self.query, **_TASK_PARAMETER_TEMPLATES["web_search"]}
             elif task_type == "webpage_parse":
-                parameters = {
-                    "urls": [],  # Will be populated from web search results
-                    "strategy": "readability",
-                    "extract_links": False,
-                    "extract_images": False,
-                    "max_content_length": 5000
-                }
+                # Fresh list per task; populated from web search results
+                parameters = {"urls": [], **_TASK_PARAMETER_TEMPLATES["webpage_parse"]}
             elif task_type == "compose":
                 parameters = {
-                    "task": "summarize",
-                    "content": "Sample content",  # Will be populated from scraping results
-                    "format": "text",
-                    "max_length": 2000,  # Increased from 1000 to 2000 for longer summaries
-                    "min_length": 1000,  # Added minimum length requirement
-                    "query": f"Provide a comprehensive summary of the following content about: {self.query}. Include key points, main themes, and important details. The summary should be detailed and informative."
+                    **_TASK_PARAMETER_TEMPLATES["compose"],
+                    "query": _COMPOSE_QUERY_TEMPLATE.format(query=self.query)
                 }
             else:
                 parameters = {
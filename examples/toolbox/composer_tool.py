@@ -13,6 +13,12 @@ from typing import Dict, List, Any, Optional, Union
 from pathlib import Path
 import sys
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add parent directory for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -21,6 +27,41 @@ from llm_tool import LLMTool
 from workflown.core.config.central_config import get_config
 
 
+# Prompt building blocks, built once at import
+_BASE_PROMPTS = {
+    "summarize": "Please provide a comprehensive summary of the following content:",
+    "analyze": "Please analyze the following content and provide key insights:",
+    "compose": "Please compose a well-structured response based on the following content:",
+    "combine": "Please combine and synthesize the following sources into a coherent analysis:"
+}
+_FORMAT_INSTRUCTIONS = {
+    "json": "Please format your response as valid JSON with appropriate fields.",
+    "markdown": "Please format your response in Markdown with proper headings and structure."
+}
+_SOURCES_INSTRUCTION = "Please include references to the sources in your response."
+_SOURCE_SEPARATOR = "\n\n" + ("=" * 80) + "\n\n"
+_SOURCE_TEMPLATE = "## Source {index}: {title}\n{url_line}\n{text}\n"
+
+
+def _dumps_indented(obj: Any) -> str:
+    """Serialize to 2-space indented JSON, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _take_within(items: List[str], max_chars: int) -> List[str]:
+    """Leading items whose joined length first reaches max_chars."""
+    taken = []
+    total = 0
+    for item in items:
+        taken.append(item)
+        total += len(item) + len(_SOURCE_SEPARATOR)
+        if total >= max_chars:
+            break
+    return taken
+
+
 class ComposerTool(BaseTool):
     """
     LLM Composer tool for text generation, summarization, and analysis.
@@ -35,7 +76,8 @@ class ComposerTool(BaseTool):
             description="Uses LLMs for text composition, summarization, and analysis",
             capabilities=[ToolCapability.TEXT_GENERATION, ToolCapability.TEXT_SUMMARIZATION],
             config=config,
-            max_concurrent_operations=3
+            # Compositions are independent, so several may run at once
+            max_concurrent_operations=(config or {}).get("max_concurrent_operations", 4)
         )
         
         # Configuration
@@ -56,9 +98,11 @@ class ComposerTool(BaseTool):
         print("------------------------------------------------------------------------------------------------")
 
         # Initialize LLM tool
+        # The LLM tool gets the same capacity so it never rejects a call the
+        # composer has accepted
         self.llm_tool = LLMTool(
             tool_id=f"{self.tool_id}_llm",
-            config=self.config
+            config={**self.config, "max_concurrent_operations": self.max_concurrent_operations}
         )
         
         # Set provider and model info for logging
@@ -109,15 +153,19 @@ class ComposerTool(BaseTool):
         )
         
         try:
+            # Character budget from central-configurable token limits
+            max_chars = None
+            if self.enable_truncation:
+                max_chars = int(self.max_input_tokens * self.token_char_ratio)
+            
             # Prepare content for processing
-            processed_content = self._prepare_content(content, task)
+            processed_content = self._prepare_content(content, task, max_chars)
             
             # Generate prompt based on task
             prompt = self._generate_prompt(task, processed_content, query, output_format, include_sources)
             
-            # Check token limits with central-configurable parameters
-            if self.enable_truncation:
-                max_chars = int(self.max_input_tokens * self.token_char_ratio)
+            # Check token limits
+            if max_chars is not None:
                 if len(prompt) > max_chars:
                     prompt = prompt[:max_chars]
                     await self._log_warning("Content truncated due to token limits",
@@ -155,9 +203,21 @@ class ComposerTool(BaseTool):
                 errors=[str(e)]
             )
     
-    def _prepare_content(self, content: Union[str, List[str], List[Dict]], task: str) -> str:
-        """Prepare content for LLM processing."""
+    def _prepare_content(
+        self,
+        content: Union[str, List[str], List[Dict]],
+        task: str,
+        max_chars: Optional[int] = None
+    ) -> str:
+        """
+        Prepare content for LLM processing.
+        
+        Content always ends the prompt, so with a max_chars budget anything
+        past it would be truncated away; stop building once it is reached.
+        """
         if isinstance(content, str):
+            if max_chars is not None and len(content) > max_chars:
+                return content[:max_chars]
             return content
         elif isinstance(content, list):
             if not content:
@@ -165,11 +225,12 @@ class ComposerTool(BaseTool):
             
             # Handle list of strings
             if isinstance(content[0], str):
-                separator = "\n\n" + ("=" * 80) + "\n\n"
                 items = content
                 if self.max_sources and self.max_sources > 0:
                     items = items[: self.max_sources]
-                return separator.join(items)
+                if max_chars is not None:
+                    items = _take_within(items, max_chars)
+                return _SOURCE_SEPARATOR.join(items)
             
             # Handle list of dictionaries (e.g., web page results)
             elif isinstance(content[0], dict):
@@ -177,20 +238,25 @@ class ComposerTool(BaseTool):
                 items = content
                 if self.max_sources and self.max_sources > 0:
                     items = items[: self.max_sources]
+                total = 0
                 for i, item in enumerate(items, 1):
                     title = item.get('title', f'Source {i}')
                     url = item.get('url', '')
                     text_content = item.get('content', '') or item.get('summary', '')
                     
-                    source_text = f"## Source {i}: {title}\n"
-                    if url:
-                        source_text += f"URL: {url}\n"
-                    source_text += f"\n{text_content}\n"
+                    part = _SOURCE_TEMPLATE.format_map({
+                        "index": i,
+                        "title": title,
+                        "url_line": f"URL: {url}\n" if url else "",
+                        "text": text_content
+                    })
+                    formatted_content.append(part)
                     
-                    formatted_content.append(source_text)
+                    total += len(part) + len(_SOURCE_SEPARATOR)
+                    if max_chars is not None and total >= max_chars:
+                        break
                 
-                separator = "\n\n" + ("=" * 80) + "\n\n"
-                return separator.join(formatted_content)
+                return _SOURCE_SEPARATOR.join(formatted_content)
         
         return str(content)
     
@@ -203,30 +269,25 @@ class ComposerTool(BaseTool):
         include_sources: bool
     ) -> str:
         """Generate appropriate prompt based on task type."""
-        base_prompts = {
-            "summarize": "Please provide a comprehensive summary of the following content:",
-            "analyze": "Please analyze the following content and provide key insights:",
-            "compose": "Please compose a well-structured response based on the following content:",
-            "combine": "Please combine and synthesize the following sources into a coherent analysis:"
-        }
-        
-        prompt = base_prompts.get(task, base_prompts["summarize"])
+        # Collect the sections and join once, so the (possibly large) content
+        # is copied a single time
+        parts = [_BASE_PROMPTS.get(task, _BASE_PROMPTS["summarize"])]
         
         if query:
-            prompt += f"\n\nSpecific focus: {query}"
+            parts.append(f"Specific focus: {query}")
         
         # Add format instructions
-        if output_format == "json":
-            prompt += "\n\nPlease format your response as valid JSON with appropriate fields."
-        elif output_format == "markdown":
-            prompt += "\n\nPlease format your response in Markdown with proper headings and structure."
+        format_instruction = _FORMAT_INSTRUCTIONS.get(output_format)
+        if format_instruction:
+            parts.append(format_instruction)
         
         if include_sources and task == "combine":
-            prompt += "\n\nPlease include references to the sources in your response."
+            parts.append(_SOURCES_INSTRUCTION)
         
-        prompt += f"\n\nContent to process:\n\n{content}"
+        parts.append("Content to process:")
+        parts.append(content)
         
-        return prompt
+        return "\n\n".join(parts)
     
     async def _call_llm(self, prompt: str, max_tokens: int, task: str, query: str) -> str:
         """Call actual LLM using LLM tool."""
@@ -272,14 +333,14 @@ class ComposerTool(BaseTool):
         if output_format == "json":
             try:
                 # Wrap response in JSON format
-                return json.dumps({
+                return _dumps_indented({
                     "content": response,
                     "format": "markdown",
                     "generated_at": datetime.now().isoformat(),
                     "word_count": len(response.split())
-                }, indent=2)
+                })
             except:
-                return json.dumps({"content": response}, indent=2)
+                return _dumps_indented({"content": response})
         
         return response
     
@@ -42,7 +42,7 @@ class LLMTool(BaseTool):
                 ToolCapability.CUSTOM
             ],
             config=config,
-            max_concurrent_operations=3  # Limit concurrent LLM calls
+            max_concurrent_operations=(config or {}).get("max_concurrent_operations", 3)  # Limit concurrent LLM calls
         )
         
         # Get Azure OpenAI configuration from central config
@@ -4,7 +4,7 @@ Web Search Tool
 Performs web searches using various search engines and APIs with robust rate limiting protection.
 
 Enhanced Features:
-- Exponential backoff retry mechanism with configurable parameters
+- Jittered backoff retry mechanism with configurable parameters
 - Intelligent request throttling based on request history and failure patterns
 - User agent rotation to avoid detection
 - Selenium-based browser fallback for when APIs are rate limited
@@ -14,12 +14,13 @@ Configuration Options:
 {
     "rate_limit_delay": 1.0,                    # Base delay between requests (seconds)
     "max_retries": 5,                          # Maximum retry attempts
-    "exponential_backoff_base": 2.0,           # Base for exponential backoff calculation
     "max_backoff_delay": 60.0,                 # Maximum backoff delay (seconds)
     "jitter_range": 0.1,                       # Jitter range for randomizing delays
     "enable_browser_fallback": true,           # Enable Selenium browser fallback
     "browser_type": "chrome",                  # Browser type: "chrome" or "firefox"  
-    "headless_browser": true                   # Run browser in headless mode
+    "headless_browser": true,                  # Run browser in headless mode
+    "cache_ttl": 600,                          # Seconds a cached search result stays valid
+    "cache_size": 256                          # Max cached queries (0 disables caching)
 }
 
 Dependencies:
@@ -29,19 +30,26 @@ Install dependencies: pip install googlesearch-python
 """
 
 import asyncio
+import copy
 import json
 import os
 from typing import Dict, List, Any, Optional
 from urllib.parse import quote_plus
-import time
 import random
 import logging
-from datetime import datetime, timedelta
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 from workflown.core.tools.base_tool import BaseTool, ToolResult, ToolCapability
+from workflown.core.logging.logger import LogLevel
 
 # Import the GoogleSearchPythonTool from websearch module
 from .websearch.googlesearch_python_search import GoogleSearchPythonTool
+from .websearch.base_search import QueryCache, canonicalize_query
 
 # Real config for LLM providers
 def get_config():
@@ -98,6 +106,11 @@ class WebSearchTool(BaseTool):
         self.language = self.config.get("language", "en")
         self.region = self.config.get("region", "US")
         
+        # LRU+TTL result cache; hits skip throttling, HTTP, parsing and logging
+        self.cache_ttl = self.config.get("cache_ttl", 600)
+        self.cache_size = self.config.get("cache_size", 256)
+        self._cache = QueryCache(max_size=self.cache_size, ttl=self.cache_ttl)
+        
         # Google search tool will be initialized in _initialize()
         self.google_search_tool = None
         self._initialize()
@@ -105,11 +118,11 @@ class WebSearchTool(BaseTool):
     def _initialize(self):
         """Initialize the Google Search Python tool."""
         # Initialize the Google Search Python tool
+        # Results are cached at this level, so the wrapped tool doesn't cache too
         self.google_search_tool = GoogleSearchPythonTool(
             tool_id=f"{self.tool_id}_google",
-            config=self.config
+            config={**self.config, "cache_size": 0}
         )
-        self.google_search_tool._initialize()
     
     async def execute(self, parameters: Dict[str, Any]) -> ToolResult:
         """
@@ -122,14 +135,11 @@ class WebSearchTool(BaseTool):
                 - max_results: Maximum number of results (default: 10)
                 - language: Language for search (optional)
                 - region: Region for search (optional)
+                - vectorized: Return {"items", "relevances"} with a NumPy array (optional)
                 
         Returns:
             ToolResult with search results
         """
-        # Ensure the google search tool is initialized
-        if self.google_search_tool is None:
-            self._initialize()
-        
         query = parameters.get("query", "")
         if not query:
             return ToolResult(
@@ -144,13 +154,28 @@ class WebSearchTool(BaseTool):
         language = parameters.get("language", self.language)
         region = parameters.get("region", self.region)
         
-        await self.logger.info(
-            f"Starting web search",
-            tool_id=self.tool_id,
-            query=query,
-            engine=engine,
-            max_results=max_results
-        )
+        cache_key = (engine, canonicalize_query(query), max_results, language, region)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            # Entry holds the results and a prebuilt metadata template; callers
+            # get a copy so they cannot mutate the cached results
+            cached_results, cached_metadata = cached
+            return ToolResult(
+                tool_id=self.tool_id,
+                success=True,
+                result=self._shape_results(copy.deepcopy(list(cached_results)), parameters),
+                metadata={**cached_metadata, "query": query}
+            )
+        
+        # Fire-and-forget: the search doesn't wait on log handlers
+        if self.logger.is_enabled_for(LogLevel.INFO):
+            self.logger.info_sync(
+                f"Starting web search",
+                tool_id=self.tool_id,
+                query=query,
+                engine=engine,
+                max_results=max_results
+            )
         
         try:
             # Use the Google Search Python tool to perform the search
@@ -172,29 +197,24 @@ class WebSearchTool(BaseTool):
                     errors=search_result.errors
                 )
             
-            # Convert SearchResult objects to dictionaries
-            results = []
-            if isinstance(search_result.result, list):
-                for result in search_result.result:
-                    if hasattr(result, 'to_dict'):
-                        results.append(result.to_dict())
-                    else:
-                        results.append(result)
-            else:
-                results = search_result.result
+            # BaseSearchTool.execute already returns plain result dicts
+            results = search_result.result or []
+            
+            metadata = {
+                "query": query,
+                "engine": engine,
+                "results_count": len(results),
+                "max_results": max_results,
+                "language": language,
+                "region": region
+            }
+            self._cache.put(cache_key, (copy.deepcopy(tuple(results)), {**metadata, "cached": True}))
             
             return ToolResult(
                 tool_id=self.tool_id,
                 success=True,
-                result=results,
-                metadata={
-                    "query": query,
-                    "engine": engine,
-                    "results_count": len(results),
-                    "max_results": max_results,
-                    "language": language,
-                    "region": region
-                }
+                result=self._shape_results(results, parameters),
+                metadata=metadata
             )
             
         except Exception as e:
@@ -213,6 +233,58 @@ class WebSearchTool(BaseTool):
                 errors=[str(e)]
             )
     
+    def _shape_results(self, results: List[Dict[str, Any]], parameters: Dict[str, Any]) -> Any:
+        """
+        Return results in the shape the caller asked for.
+        
+        With ``vectorized`` set (and NumPy installed) the list is paired with a
+        float32 array of relevances so downstream ranking can use argsort.
+        """
+        if not (parameters.get("vectorized") and NUMPY_AVAILABLE):
+            return results
+        
+        relevances = np.fromiter(
+            (r.get("relevance", 0.0) for r in results),
+            dtype=np.float32,
+            count=len(results)
+        )
+        return {"items": results, "relevances": relevances}
+    
+    async def execute_many(self, batch: List[Dict[str, Any]]) -> List[ToolResult]:
+        """
+        Execute several searches concurrently.
+        
+        Up to max_concurrent_operations searches are in flight at once; results
+        are returned in the same order as the batch.
+        
+        Args:
+            batch: List of parameter dicts, each accepted by execute()
+            
+        Returns:
+            List of ToolResult, one per batch entry
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_operations)
+        
+        async def _run_one(parameters: Dict[str, Any]) -> ToolResult:
+            async with semaphore:
+                return await self.execute(parameters)
+        
+        outcomes = await asyncio.gather(
+            *(_run_one(parameters) for parameters in batch),
+            return_exceptions=True
+        )
+        
+        return [
+            outcome if isinstance(outcome, ToolResult) else ToolResult(
+                tool_id=self.tool_id,
+                success=False,
+                result=None,
+                metadata={"query": parameters.get("query", "")},
+                errors=[str(outcome)]
+            )
+            for parameters, outcome in zip(batch, outcomes)
+        ]
+    
     def get_supported_operations(self) -> List[str]:
         """Get supported operations."""
         return ["web_search", "search", "find"]
@@ -235,7 +307,7 @@ class WebSearchTool(BaseTool):
     
     def _get_optional_parameters(self) -> List[str]:
         """Get optional parameters."""
-        return ["engine", "max_results", "language", "region"]
+        return ["engine", "max_results", "language", "region", "vectorized"]
     
     def _get_parameter_descriptions(self) -> Dict[str, str]:
         """Get parameter descriptions."""
@@ -244,7 +316,8 @@ class WebSearchTool(BaseTool):
             "engine": "Search engine to use (google)",
             "max_results": "Maximum number of results to return",
             "language": "Language for search results",
-            "region": "Region for search results"
+            "region": "Region for search results",
+            "vectorized": "Also return relevances as a NumPy array for downstream ranking"
         }
     
     def _get_parameter_types(self) -> Dict[str, str]:
@@ -254,7 +327,8 @@ class WebSearchTool(BaseTool):
             "engine": "string",
             "max_results": "integer",
             "language": "string",
-            "region": "string"
+            "region": "string",
+            "vectorized": "boolean"
         }
     
     async def cleanup(self):
@@ -25,6 +25,12 @@ from .webscrapers import ScraperManager, ScrapedContent
 class WebPageContent:
     """Represents parsed web page content."""
     
+    __slots__ = (
+        'url', 'title', 'content', 'summary', 'markdown_content', 'metadata',
+        'links', 'images', 'extracted_at',
+        '_content_len', '_summary_len', '_markdown_len', '_extracted_iso'
+    )
+    
     def __init__(
         self,
         url: str,
@@ -45,6 +51,12 @@ class WebPageContent:
         self.links = links or []
         self.images = images or []
         self.extracted_at = datetime.now()
+        
+        # Derived fields are computed once; instances are not mutated after creation
+        self._content_len = len(content)
+        self._summary_len = len(summary)
+        self._markdown_len = len(markdown_content)
+        self._extracted_iso = self.extracted_at.isoformat()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary format."""
@@ -57,10 +69,10 @@ class WebPageContent:
             'metadata': self.metadata,
             'links': self.links,
             'images': self.images,
-            'extracted_at': self.extracted_at.isoformat(),
-            'content_length': len(self.content),
-            'summary_length': len(self.summary),
-            'markdown_length': len(self.markdown_content)
+            'extracted_at': self._extracted_iso,
+            'content_length': self._content_len,
+            'summary_length': self._summary_len,
+            'markdown_length': self._markdown_len
         }
     
     @classmethod
@@ -101,6 +113,7 @@ class WebPageParserTool(BaseTool):
         self.rate_limit_delay = self.config.get("rate_limit_delay", 1.0)  # seconds
         self.max_retries = self.config.get("max_retries", 3)
         self.timeout = self.config.get("timeout", 30)
+        self.bs4_parser = self.config.get("bs4_parser", "lxml")
         
         self.user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
@@ -111,10 +124,14 @@ class WebPageParserTool(BaseTool):
         self.last_request_time = 0
         
         # Initialize scraper manager
-        self.scraper_manager = ScraperManager()
+        self.scraper_manager = ScraperManager(bs4_parser=self.bs4_parser)
         
         # Session for HTTP requests
         self.session = None
+        
+        # Cap on URLs scraped at once; the semaphore is created on first use
+        self.max_concurrent_urls = self.config.get("max_concurrent_urls", 16)
+        self._concurrency_sem: Optional[asyncio.Semaphore] = None
 
         self._initialize()
     
@@ -157,48 +174,24 @@ class WebPageParserTool(BaseTool):
             max_content_length = parameters.get("max_content_length", self.max_content_length)
             specific_scraper = parameters.get("scraper")
             
-            # Parse each URL
+            # Parse URLs concurrently, bounded by max_concurrent_urls
+            if self._concurrency_sem is None:
+                self._concurrency_sem = asyncio.Semaphore(self.max_concurrent_urls)
+            
+            async def _bounded(url: str) -> Dict[str, Any]:
+                async with self._concurrency_sem:
+                    return await self._parse_single_url(
+                        url, extract_links, extract_images, specific_scraper
+                    )
+            
+            gathered = await asyncio.gather(*[_bounded(url) for url in urls], return_exceptions=True)
             results = []
-            for url in urls:
-                try:
-                    # Extract content using scraper manager
-                    if specific_scraper:
-                        # Use specific scraper
-                        scraped_content = await self.scraper_manager.extract_with_scraper(
-                            specific_scraper, url, extract_links, extract_images
-                        )
-                    else:
-                        # Use best available scraper
-                        scraped_content = await self.scraper_manager.extract_with_best_scraper(
-                            url, extract_links, extract_images
-                        )
-                    
-                    # Convert to WebPageContent format
-                    content = WebPageContent.from_scraped_content(scraped_content)
-                    
-                    results.append(content.to_dict())
-                    
-                except Exception as e:
-                    # Add error result for this URL
-                    error_msg = str(e)
+            for url, outcome in zip(urls, gathered):
+                if isinstance(outcome, BaseException):
+                    error_msg = str(outcome)
                     print(f"❌ Failed to scrape {url}: {error_msg}")
-                    results.append({
-                        'url': url,
-                        'title': '',
-                        'content': '',
-                        'summary': '',
-                        'markdown_content': '',
-                        'metadata': {
-                            'error': error_msg,
-                            'extraction_method': 'failed'
-                        },
-                        'links': [],
-                        'images': [],
-                        'extracted_at': datetime.now().isoformat(),
-                        'content_length': 0,
-                        'summary_length': 0,
-                        'markdown_length': 0
-                    })
+                    outcome = self._failed_result(url, error_msg)
+                results.append(outcome)
             
             # Filter out results with no content and add fallback content if needed
             valid_results = []
@@ -247,6 +240,48 @@ class WebPageParserTool(BaseTool):
                 errors=[str(e)]
             )
     
+    async def _parse_single_url(
+        self,
+        url: str,
+        extract_links: bool,
+        extract_images: bool,
+        specific_scraper: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Scrape one URL and return its content as a result dict."""
+        if specific_scraper:
+            # Use specific scraper
+            scraped_content = await self.scraper_manager.extract_with_scraper(
+                specific_scraper, url, extract_links, extract_images
+            )
+        else:
+            # Use best available scraper
+            scraped_content = await self.scraper_manager.extract_with_best_scraper(
+                url, extract_links, extract_images
+            )
+        
+        # Convert to WebPageContent format
+        return WebPageContent.from_scraped_content(scraped_content).to_dict()
+    
+    def _failed_result(self, url: str, error_msg: str) -> Dict[str, Any]:
+        """Build the result entry for a URL that could not be scraped."""
+        return {
+            'url': url,
+            'title': '',
+            'content': '',
+            'summary': '',
+            'markdown_content': '',
+            'metadata': {
+                'error': error_msg,
+                'extraction_method': 'failed'
+            },
+            'links': [],
+            'images': [],
+            'extracted_at': datetime.now().isoformat(),
+            'content_length': 0,
+            'summary_length': 0,
+            'markdown_length': 0
+        }
+    
     def get_supported_operations(self) -> List[str]:
         """Get supported operations."""
         return ["webpage_parse", "content_extraction", "web_scraping"]
@@ -301,18 +336,15 @@ class WebPageParserTool(BaseTool):
     # Logging helpers
     async def _log_info(self, message: str, **kwargs):
         """Log info message."""
-        if hasattr(self, 'logger'):
-            await self.logger.info(message, tool_id=self.tool_id, **kwargs)
+        await self.logger.info(message, tool_id=self.tool_id, **kwargs)
     
     async def _log_warning(self, message: str, **kwargs):
         """Log warning message."""
-        if hasattr(self, 'logger'):
-            await self.logger.warning(message, tool_id=self.tool_id, **kwargs)
+        await self.logger.warning(message, tool_id=self.tool_id, **kwargs)
     
     async def _log_error(self, message: str, **kwargs):
         """Log error message."""
-        if hasattr(self, 'logger'):
-            await self.logger.error(message, tool_id=self.tool_id, **kwargs)
+        await self.logger.error(message, tool_id=self.tool_id, **kwargs)
 
     # ------------------------------------------------------------------
     # Result display override
@@ -11,6 +11,7 @@ from .web_crawler import (
     crawl_url, crawl_urls
 )
 from .beautifulsoup_scraper import BeautifulSoupScraper
+from .selectolax_scraper import SelectolaxScraper
 from .trafilatura_scraper import TrafilaturaScraper
 from .newspaper3k_scraper import Newspaper3kScraper
 from .readability_scraper import ReadabilityScraper
@@ -30,6 +31,7 @@ __all__ = [
     'crawl_url',
     'crawl_urls',
     'BeautifulSoupScraper',
+    'SelectolaxScraper',
     'TrafilaturaScraper',
     'Newspaper3kScraper',
     'ReadabilityScraper',
@@ -5,6 +5,8 @@ Abstract base class for web scrapers with common functionality.
 """
 
 import asyncio
+import html
+import re
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
@@ -12,6 +14,57 @@ from datetime import datetime
 
 from .web_crawler import WebCrawler, CrawlConfig, CrawledPage
 
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# C-based lxml parses several times faster than the pure-Python html.parser
+DEFAULT_BS4_PARSER = "lxml" if LXML_AVAILABLE else "html.parser"
+
+
+def resolve_bs4_parser(parser: Optional[str] = None) -> str:
+    """Return the BeautifulSoup parser to use, falling back to html.parser without lxml."""
+    if not parser:
+        return DEFAULT_BS4_PARSER
+    if parser.startswith("lxml") and not LXML_AVAILABLE:
+        return "html.parser"
+    return parser
+
+
+_RE_SCRIPT_STYLE_OPEN = re.compile(r'<(script|style)\b[^>]*>', re.IGNORECASE)
+_RE_BLOCK_CLOSE = {
+    "script": re.compile(r'</script\s*>', re.IGNORECASE),
+    "style": re.compile(r'</style\s*>', re.IGNORECASE),
+}
+
+
+def strip_scripts_and_styles(html_content: str) -> str:
+    """
+    Remove <script> and <style> blocks so parsers never build their subtrees.
+    
+    A single forward scan: stops at the first block that is never closed
+    (e.g. truncated HTML) and leaves the rest to the parser, so the cost
+    stays linear in the document size.
+    """
+    parts = []
+    pos = 0
+    while True:
+        opener = _RE_SCRIPT_STYLE_OPEN.search(html_content, pos)
+        if opener is None:
+            break
+        closer = _RE_BLOCK_CLOSE[opener.group(1).lower()].search(html_content, opener.end())
+        if closer is None:
+            break
+        parts.append(html_content[pos:opener.start()])
+        pos = closer.end()
+    
+    if not parts:
+        return html_content
+    parts.append(html_content[pos:])
+    return ''.join(parts)
+
 
 @dataclass
 class ScrapedContent:
@@ -28,10 +81,9 @@ class ScrapedContent:
     extracted_at: datetime = None
     
     def __post_init__(self):
-        if self.links is None:
-            self.links = []
-        if self.images is None:
-            self.images = []
+        # Drop repeated URLs (e.g. template nav links) while keeping page order
+        self.links = list(dict.fromkeys(self.links)) if self.links else []
+        self.images = list(dict.fromkeys(self.images)) if self.images else []
         if self.metadata is None:
             self.metadata = {}
         if self.extracted_at is None:
@@ -166,17 +218,10 @@ class BaseWebScraper(ABC):
         if not text:
             return ""
         
-        # Remove extra whitespace
-        text = ' '.join(text.split())
-        
-        # Remove common HTML artifacts
-        text = text.replace('&nbsp;', ' ')
-        text = text.replace('&amp;', '&')
-        text = text.replace('&lt;', '<')
-        text = text.replace('&gt;', '>')
-        text = text.replace('&quot;', '"')
-        
-        return text.strip()
+        # Decode leftover HTML entities in one pass (a no-op without '&'),
+        # then collapse whitespace; str.split() also treats &nbsp; as a space
+        text = html.unescape(text)
+        return ' '.join(text.split())
     
     def generate_summary(self, content: str, max_length: int = 200) -> str:
         """
@@ -192,14 +237,17 @@ class BaseWebScraper(ABC):
         if not content:
             return ""
         
-        # Simple summary: take first few sentences
-        sentences = content.split('.')
-        summary = ""
+        if len(content) <= max_length:
+            return content.strip()
         
-        for sentence in sentences:
-            if len(summary + sentence) <= max_length:
-                summary += sentence + "."
-            else:
+        # Simple summary: take whole sentences from the start while they fit;
+        # only the first max_length characters can contribute, so never scan further
+        prefix = content[:max_length + 1]
+        end = 0
+        while True:
+            stop = prefix.find('.', end)
+            if stop == -1 or stop >= max_length:
                 break
+            end = stop + 1
         
-        return summary.strip() or content[:max_length].strip() 
\ No newline at end of file
+        return prefix[:end].strip() or content[:max_length].strip() 
\ No newline at end of file
@@ -7,7 +7,7 @@ Vanilla HTML parsing using BeautifulSoup with markdown conversion.
 from typing import Dict, List, Any, Optional
 
 try:
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
     BEAUTIFULSOUP_AVAILABLE = True
 except ImportError:
     BEAUTIFULSOUP_AVAILABLE = False
@@ -18,7 +18,9 @@ try:
 except ImportError:
     MARKDOWNIFY_AVAILABLE = False
 
-from .base_scraper import BaseWebScraper, ScrapedContent
+from .base_scraper import (
+    BaseWebScraper, ScrapedContent, resolve_bs4_parser, strip_scripts_and_styles
+)
 
 
 class BeautifulSoupScraper(BaseWebScraper):
@@ -28,12 +30,13 @@ class BeautifulSoupScraper(BaseWebScraper):
     Uses BeautifulSoup for HTML parsing and markdownify for HTML to Markdown conversion.
     """
     
-    def __init__(self):
+    def __init__(self, bs4_parser: Optional[str] = None):
         super().__init__(
             name="BeautifulSoup Scraper",
             description="Vanilla HTML parsing using BeautifulSoup with markdown conversion"
         )
         self.supports_markdown = MARKDOWNIFY_AVAILABLE
+        self.bs4_parser = resolve_bs4_parser(bs4_parser)
     
     def _check_availability(self) -> bool:
         """Check if BeautifulSoup is available."""
@@ -60,11 +63,13 @@ class BeautifulSoupScraper(BaseWebScraper):
             raise RuntimeError("BeautifulSoup is not available")
         
         # Fetch HTML content from URL
-        html_content = await self._fetch_html_content(url)
+        html_content = strip_scripts_and_styles(await self._fetch_html_content(url))
         
         try:
-            # Parse HTML with BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
+            # Parse HTML with BeautifulSoup, skipping <head> (scripts, styles, meta)
+            # except for the title since nothing else there is used
+            strainer = SoupStrainer(['title', 'body'])
+            soup = BeautifulSoup(html_content, self.bs4_parser, parse_only=strainer)
             
             # Extract title
             title = ""
@@ -91,7 +96,7 @@ class BeautifulSoupScraper(BaseWebScraper):
                 body = soup.find('body')
                 if body:
                     # Remove navigation, footer, and other non-content elements
-                    for element in body.find_all(['nav', 'footer', 'header', 'aside', 'script', 'style']):
+                    for element in body.find_all(['nav', 'footer', 'header', 'aside']):
                         element.decompose()
                     content = body.get_text()
             
@@ -113,7 +118,7 @@ class BeautifulSoupScraper(BaseWebScraper):
                         # Use the cleaned body HTML
                         body = soup.find('body')
                         if body:
-                            for element in body.find_all(['nav', 'footer', 'header', 'aside', 'script', 'style']):
+                            for element in body.find_all(['nav', 'footer', 'header', 'aside']):
                                 element.decompose()
                             markdown_content = markdownify(str(body), heading_style="ATX")
                 except Exception:
@@ -123,17 +128,17 @@ class BeautifulSoupScraper(BaseWebScraper):
             links = []
             images = []
             
-            if extract_links:
-                for link in soup.find_all('a', href=True):
-                    href = link.get('href')
-                    if href and href.startswith(('http', 'https')):
-                        links.append(href)
-            
-            if extract_images:
-                for img in soup.find_all('img', src=True):
-                    src = img.get('src')
-                    if src and src.startswith(('http', 'https')):
-                        images.append(src)
+            if extract_links or extract_images:
+                # One traversal for both tag types
+                for element in soup.find_all(['a', 'img']):
+                    if element.name == 'a':
+                        href = element.get('href') if extract_links else None
+                        if href and href.startswith(('http', 'https')):
+                            links.append(href)
+                    else:
+                        src = element.get('src') if extract_images else None
+                        if src and src.startswith(('http', 'https')):
+                            images.append(src)
             
             # Clean and summarize content
             cleaned_content = self.clean_text(content)
@@ -8,6 +8,7 @@ from typing import Dict, List, Any, Optional
 
 try:
     from langchain_community.document_transformers import BeautifulSoupTransformer
+    from langchain_core.documents import Document
     LANGCHAIN_AVAILABLE = True
 except ImportError:
     LANGCHAIN_AVAILABLE = False
@@ -83,7 +84,6 @@ class LangChainScraper(BaseWebScraper):
             try:
                 transformer = BeautifulSoupTransformer()
                 # Create a simple document structure for the transformer
-                from langchain_core.documents import Document
                 doc = Document(page_content=html_content, metadata={"source": url})
                 transformed_docs = transformer.transform_documents([doc])
                 if transformed_docs:
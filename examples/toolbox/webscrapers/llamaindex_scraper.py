@@ -8,6 +8,7 @@ from typing import Dict, List, Any, Optional
 
 try:
     from llama_index.readers.web import BeautifulSoupWebReader
+    from llama_index.core import Document
     LLAMAINDEX_AVAILABLE = True
 except ImportError:
     LLAMAINDEX_AVAILABLE = False
@@ -83,7 +84,6 @@ class LlamaIndexScraper(BaseWebScraper):
             try:
                 reader = BeautifulSoupWebReader()
                 # Create a simple document structure for the reader
-                from llama_index.core import Document
                 doc = Document(text=html_content, metadata={"source": url})
                 documents = reader.load_data(documents=[doc])
                 if documents:
@@ -13,6 +13,12 @@ try:
 except ImportError:
     NEWSPAPER3K_AVAILABLE = False
 
+try:
+    from bs4 import BeautifulSoup
+    BEAUTIFULSOUP_AVAILABLE = True
+except ImportError:
+    BEAUTIFULSOUP_AVAILABLE = False
+
 try:
     from markdownify import markdownify
     MARKDOWNIFY_AVAILABLE = True
@@ -91,9 +97,8 @@ class Newspaper3kScraper(BaseWebScraper):
                 try:
                     if hasattr(article, 'links'):
                         links = article.links or []
-                    else:
+                    elif BEAUTIFULSOUP_AVAILABLE:
                         # Extract links manually from HTML
-                        from bs4 import BeautifulSoup
                         soup = BeautifulSoup(html_content, 'html.parser')
                         for link in soup.find_all('a', href=True):
                             href = link.get('href')
@@ -107,9 +112,8 @@ class Newspaper3kScraper(BaseWebScraper):
                 try:
                     if hasattr(article, 'images'):
                         images = article.images or []
-                    else:
+                    elif BEAUTIFULSOUP_AVAILABLE:
                         # Extract images manually from HTML
-                        from bs4 import BeautifulSoup
                         soup = BeautifulSoup(html_content, 'html.parser')
                         for img in soup.find_all('img', src=True):
                             src = img.get('src')
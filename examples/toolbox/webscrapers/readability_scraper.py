@@ -12,8 +12,15 @@ try:
 except ImportError:
     READABILITY_AVAILABLE = False
 
+# readability-lxml already depends on lxml; use it directly to avoid a BS4 re-parse
 try:
-    from bs4 import BeautifulSoup
+    from lxml import html as lxml_html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    from bs4 import BeautifulSoup, SoupStrainer
     BEAUTIFULSOUP_AVAILABLE = True
 except ImportError:
     BEAUTIFULSOUP_AVAILABLE = False
@@ -24,7 +31,9 @@ try:
 except ImportError:
     MARKDOWNIFY_AVAILABLE = False
 
-from .base_scraper import BaseWebScraper, ScrapedContent
+from .base_scraper import (
+    BaseWebScraper, ScrapedContent, resolve_bs4_parser, strip_scripts_and_styles
+)
 
 
 class ReadabilityScraper(BaseWebScraper):
@@ -34,12 +43,13 @@ class ReadabilityScraper(BaseWebScraper):
     Uses Readability for content extraction and markdownify for HTML to Markdown conversion.
     """
     
-    def __init__(self):
+    def __init__(self, bs4_parser: Optional[str] = None):
         super().__init__(
             name="Readability Scraper",
             description="Content extraction using Readability with markdown conversion"
         )
         self.supports_markdown = MARKDOWNIFY_AVAILABLE
+        self.bs4_parser = resolve_bs4_parser(bs4_parser)
     
     def _check_availability(self) -> bool:
         """Check if Readability is available."""
@@ -86,15 +96,20 @@ class ReadabilityScraper(BaseWebScraper):
                     }
                 )
             
+            # Scripts and styles are never content; drop them before any parse
+            html_content = strip_scripts_and_styles(html_content)
+            
             # Extract content using readability
             doc = Document(html_content)
             content_html = doc.summary()  # This returns HTML
             title = doc.title()
             
-            # Convert HTML content to plain text using BeautifulSoup
+            # Convert HTML content to plain text
             content = ""
-            if content_html and BEAUTIFULSOUP_AVAILABLE:
-                soup = BeautifulSoup(content_html, 'html.parser')
+            if content_html and LXML_AVAILABLE:
+                content = lxml_html.fromstring(content_html).text_content()
+            elif content_html and BEAUTIFULSOUP_AVAILABLE:
+                soup = BeautifulSoup(content_html, self.bs4_parser)
                 content = soup.get_text()
             else:
                 content = content_html or ""
@@ -111,23 +126,37 @@ class ReadabilityScraper(BaseWebScraper):
             links = []
             images = []
             
-            if extract_links and BEAUTIFULSOUP_AVAILABLE:
+            if (extract_links or extract_images) and LXML_AVAILABLE:
                 try:
-                    soup = BeautifulSoup(html_content, 'html.parser')
-                    for link in soup.find_all('a', href=True):
-                        href = link.get('href')
-                        if href and href.startswith(('http', 'https')):
-                            links.append(href)
+                    root = lxml_html.fromstring(html_content)
+                    if extract_links:
+                        links = [
+                            href for href in root.xpath('//a/@href')
+                            if href.startswith(('http', 'https'))
+                        ]
+                    if extract_images:
+                        images = [
+                            src for src in root.xpath('//img/@src')
+                            if src.startswith(('http', 'https'))
+                        ]
                 except Exception:
                     pass
-            
-            if extract_images and BEAUTIFULSOUP_AVAILABLE:
+            elif (extract_links or extract_images) and BEAUTIFULSOUP_AVAILABLE:
+                # Only build <a>/<img> nodes; the rest of the page is already in content_html
+                wanted = [tag for tag, enabled in (('a', extract_links), ('img', extract_images)) if enabled]
                 try:
-                    soup = BeautifulSoup(html_content, 'html.parser')
-                    for img in soup.find_all('img', src=True):
-                        src = img.get('src')
-                        if src and src.startswith(('http', 'https')):
-                            images.append(src)
+                    soup = BeautifulSoup(
+                        html_content, self.bs4_parser, parse_only=SoupStrainer(wanted)
+                    )
+                    for element in soup.find_all(wanted):
+                        if element.name == 'a':
+                            href = element.get('href')
+                            if href and href.startswith(('http', 'https')):
+                                links.append(href)
+                        else:
+                            src = element.get('src')
+                            if src and src.startswith(('http', 'https')):
+                                images.append(src)
                 except Exception:
                     pass
             
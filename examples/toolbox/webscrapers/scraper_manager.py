@@ -4,9 +4,10 @@ Scraper Manager
 Manages multiple web scrapers and selects the best one for content extraction.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from .base_scraper import BaseWebScraper, ScrapedContent
 from .beautifulsoup_scraper import BeautifulSoupScraper
+from .selectolax_scraper import SelectolaxScraper
 from .trafilatura_scraper import TrafilaturaScraper
 from .newspaper3k_scraper import Newspaper3kScraper
 from .readability_scraper import ReadabilityScraper
@@ -27,10 +28,29 @@ class ScraperManager:
     Manages multiple web scrapers and provides intelligent selection.
     """
     
-    def __init__(self):
-        """Initialize the scraper manager with all available scrapers."""
+    # Default preference order based on quality and reliability
+    DEFAULT_PREFERENCE = (
+        "Firecrawl Scraper",
+        "Trafilatura Scraper",
+        "Newspaper3k Scraper",
+        "Selectolax Scraper",
+        "Readability Scraper",
+        "BeautifulSoup Scraper",
+        "LangChain Scraper",
+        "LlamaIndex Scraper"
+    )
+    
+    def __init__(self, bs4_parser: Optional[str] = None):
+        """
+        Initialize the scraper manager with all available scrapers.
+        
+        Args:
+            bs4_parser: BeautifulSoup parser for the HTML-based scrapers (default: lxml)
+        """
+        self.bs4_parser = bs4_parser
         self.scrapers = {}
         self._initialize_scrapers()
+        self._default_chain = self._build_chain(self.DEFAULT_PREFERENCE)
     
     def _initialize_scrapers(self):
         """Initialize all available scrapers."""
@@ -47,8 +67,9 @@ class ScraperManager:
             (FirecrawlScraper, {"api_key": firecrawl_api_key}),
             (TrafilaturaScraper, {}),
             (Newspaper3kScraper, {}),
-            (ReadabilityScraper, {}),
-            (BeautifulSoupScraper, {}),
+            (SelectolaxScraper, {}),
+            (ReadabilityScraper, {"bs4_parser": self.bs4_parser}),
+            (BeautifulSoupScraper, {"bs4_parser": self.bs4_parser}),
             (LangChainScraper, {}),
             (LlamaIndexScraper, {})
         ]
@@ -58,6 +79,24 @@ class ScraperManager:
             if scraper.is_available:
                 self.scrapers[scraper.name] = scraper
     
+    def _build_chain(self, preferred_scrapers: Sequence[str]) -> List[Tuple[str, BaseWebScraper]]:
+        """
+        Resolve a preference list into the (name, scraper) order to try.
+        
+        Available preferred scrapers come first, followed by every other
+        available scraper in registration order.
+        """
+        chain = [
+            (name, self.scrapers[name]) for name in preferred_scrapers
+            if name in self.scrapers
+        ]
+        preferred = set(preferred_scrapers)
+        chain.extend(
+            (name, scraper) for name, scraper in self.scrapers.items()
+            if name not in preferred
+        )
+        return chain
+    
     def get_available_scrapers(self) -> List[str]:
         """Get list of available scraper names."""
         return list(self.scrapers.keys())
@@ -118,54 +157,27 @@ class ScraperManager:
             ScrapedContent object with extracted information
         """
         if preferred_scrapers is None:
-            # Default preference order based on quality and reliability
-            preferred_scrapers = [
-                "Firecrawl Scraper",
-                "Trafilatura Scraper",
-                "Newspaper3k Scraper", 
-                "Readability Scraper",
-                "BeautifulSoup Scraper",
-                "LangChain Scraper",
-                "LlamaIndex Scraper"
-            ]
-        
-        # Try preferred scrapers in order
-        for scraper_name in preferred_scrapers:
-            if scraper_name in self.scrapers:
-                try:
-                    result = await self.extract_with_scraper(
-                        scraper_name, url, extract_links, extract_images
-                    )
-                    # Check if we got meaningful content (either text or markdown)
-                    has_content = (
-                        (result.content and len(result.content.strip()) > 50) or
-                        (result.markdown_content and len(result.markdown_content.strip()) > 50)
-                    )
-                    if has_content:
-                        return result
-                except Exception as e:
-                    # Log the error but continue with next scraper
-                    print(f"⚠️  {scraper_name} failed for {url}: {str(e)}")
-                    continue
+            chain = self._default_chain
+        else:
+            chain = self._build_chain(preferred_scrapers)
         
-        # If no preferred scrapers worked, try any available scraper
-        for scraper_name, scraper in self.scrapers.items():
-            if scraper_name not in preferred_scrapers:  # Only try scrapers not in preferred list
-                try:
-                    result = await scraper.extract_content(
-                        url, extract_links, extract_images
-                    )
-                    # Check if we got meaningful content (either text or markdown)
-                    has_content = (
-                        (result.content and len(result.content.strip()) > 50) or
-                        (result.markdown_content and len(result.markdown_content.strip()) > 50)
-                    )
-                    if has_content:
-                        return result
-                except Exception as e:
-                    # Log the error but continue with next scraper
-                    print(f"⚠️  {scraper_name} failed for {url}: {str(e)}")
-                    continue
+        # Try preferred scrapers in order, then any other available scraper
+        for scraper_name, scraper in chain:
+            try:
+                result = await scraper.extract_content(
+                    url, extract_links, extract_images
+                )
+                # Check if we got meaningful content (either text or markdown)
+                has_content = (
+                    (result.content and len(result.content.strip()) > 50) or
+                    (result.markdown_content and len(result.markdown_content.strip()) > 50)
+                )
+                if has_content:
+                    return result
+            except Exception as e:
+                # Log the error but continue with next scraper
+                print(f"⚠️  {scraper_name} failed for {url}: {str(e)}")
+                continue
         
         # If all scrapers failed, return empty result
         return ScrapedContent(
@@ -0,0 +1,140 @@
+"""
+Selectolax Web Scraper
+
+Fast HTML parsing using selectolax's lexbor engine with markdown conversion.
+"""
+
+from typing import Dict, List, Any, Optional
+from urllib.parse import urlsplit
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+try:
+    from markdownify import markdownify
+    MARKDOWNIFY_AVAILABLE = True
+except ImportError:
+    MARKDOWNIFY_AVAILABLE = False
+
+from .base_scraper import BaseWebScraper, ScrapedContent
+from .web_crawler import fast_urljoin
+
+MAIN_SELECTORS = (
+    'main', 'article', '[role="main"]', '.content', '.post-content',
+    '.entry-content', '.article-content', '.main-content', '.post-body',
+    '.article-body', '.content-body', '.text-content'
+)
+
+
+class SelectolaxScraper(BaseWebScraper):
+    """
+    Selectolax-based web scraper for HTML parsing.
+    
+    Mirrors the BeautifulSoup scraper's extraction on top of the C lexbor parser,
+    which is an order of magnitude faster on large pages.
+    """
+    
+    def __init__(self):
+        super().__init__(
+            name="Selectolax Scraper",
+            description="Fast HTML parsing using selectolax (lexbor) with markdown conversion"
+        )
+        self.supports_markdown = MARKDOWNIFY_AVAILABLE
+    
+    def _check_availability(self) -> bool:
+        """Check if selectolax is available."""
+        return SELECTOLAX_AVAILABLE
+    
+    async def extract_content(
+        self,
+        url: str,
+        extract_links: bool = False,
+        extract_images: bool = False
+    ) -> ScrapedContent:
+        """
+        Extract content using selectolax.
+        
+        Args:
+            url: Source URL to fetch and extract content from
+            extract_links: Whether to extract links
+            extract_images: Whether to extract images
+            
+        Returns:
+            ScrapedContent object with extracted information
+        """
+        if not self.is_available:
+            raise RuntimeError("selectolax is not available")
+        
+        # Fetch HTML content from URL
+        html_content = await self._fetch_html_content(url)
+        
+        try:
+            tree = LexborHTMLParser(html_content)
+            
+            # Extract title
+            title_node = tree.css_first('title')
+            title = title_node.text(strip=True) if title_node else ""
+            
+            # Links and images are collected before non-content nodes are dropped
+            links = []
+            images = []
+            base = urlsplit(url)
+            
+            if extract_links:
+                for node in tree.css('a[href]'):
+                    href = fast_urljoin(base, url, node.attributes.get('href') or '')
+                    if href.startswith(('http', 'https')):
+                        links.append(href)
+            
+            if extract_images:
+                for node in tree.css('img[src]'):
+                    src = fast_urljoin(base, url, node.attributes.get('src') or '')
+                    if src.startswith(('http', 'https')):
+                        images.append(src)
+            
+            # Remove non-content elements
+            for node in tree.css('script, style, nav, header, footer, aside'):
+                node.decompose()
+            
+            # Extract main content, falling back to the cleaned body
+            main_node = None
+            for selector in MAIN_SELECTORS:
+                main_node = tree.css_first(selector)
+                if main_node is not None:
+                    break
+            if main_node is None:
+                main_node = tree.body
+            
+            content = main_node.text(separator=' ') if main_node is not None else ""
+            
+            # Convert to markdown if markdownify is available
+            markdown_content = ""
+            if MARKDOWNIFY_AVAILABLE and main_node is not None:
+                try:
+                    markdown_content = markdownify(main_node.html, heading_style="ATX")
+                except Exception:
+                    pass
+            
+            # Clean and summarize content
+            cleaned_content = self.clean_text(content)
+            summary = self.generate_summary(cleaned_content)
+            
+            return ScrapedContent(
+                url=url,
+                title=title,
+                content=cleaned_content,
+                markdown_content=markdown_content,
+                summary=summary,
+                links=links,
+                images=images,
+                metadata={
+                    'extraction_method': 'selectolax',
+                    'supports_markdown': MARKDOWNIFY_AVAILABLE
+                }
+            )
+            
+        except Exception as e:
+            raise RuntimeError(f"Selectolax extraction failed: {str(e)}")
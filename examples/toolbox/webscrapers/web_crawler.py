@@ -7,11 +7,12 @@ with configurable limits. Supports various crawling strategies and rate limiting
 
 import asyncio
 import aiohttp
+import itertools
 import time
 from typing import Dict, List, Any, Optional, Set, Union
 from dataclasses import dataclass, field
 from datetime import datetime
-from urllib.parse import urljoin, urlparse
+from urllib.parse import SplitResult, urljoin, urlparse, urlsplit
 import re
 from enum import Enum
 import random
@@ -33,6 +34,44 @@ try:
 except Exception:  # pragma: no cover
     _SELENIUM_AVAILABLE = False
 
+# Compiled once; these run over every fetched page
+_RE_TITLE = re.compile(r'<title[^>]*>([^<]+)</title>', re.IGNORECASE)
+_RE_HREF = re.compile(r'href=["\']([^"\']+)["\']', re.IGNORECASE)
+_RE_SRC = re.compile(r'src=["\']([^"\']+)["\']', re.IGNORECASE)
+
+# Media types whose bodies are worth decoding as page text
+_TEXT_CONTENT_TYPES = frozenset({
+    'text/html', 'application/xhtml+xml', 'application/xml', 'text/xml', 'text/plain'
+})
+
+
+def fast_urljoin(base: SplitResult, base_url: str, href: str) -> str:
+    """
+    Resolve href against a pre-split base URL.
+    
+    Handles the common absolute, scheme-relative, root-relative and plain
+    relative forms with string operations; anything with a query, fragment,
+    scheme or dot segments goes through urljoin.
+    
+    Args:
+        base: urlsplit() of base_url
+        base_url: Base URL for resolving relative links
+        href: Link to resolve
+        
+    Returns:
+        Absolute URL
+    """
+    if href.startswith(('http://', 'https://')):
+        return href
+    if not href or '/.' in href or href.startswith(('.', '?', '#')) or ':' in href:
+        return urljoin(base_url, href)
+    if href.startswith('//'):
+        return f"{base.scheme}:{href}"
+    if href.startswith('/'):
+        return f"{base.scheme}://{base.netloc}{href}"
+    directory = base.path.rsplit('/', 1)[0]
+    return f"{base.scheme}://{base.netloc}{directory}/{href}"
+
 
 class CrawlStrategy(Enum):
     """Crawling strategies."""
@@ -59,6 +98,9 @@ class CrawlConfig:
     max_content_length: int = 10 * 1024 * 1024  # 10MB
     max_retries: int = 3
     retry_backoff_base: float = 0.8
+    # Connection pool limits
+    conn_limit: int = 200
+    conn_per_host: int = 8
     # Browser fallback options
     enable_browser_fallback: bool = True
     browser_engine: str = "playwright"  # or "selenium"
@@ -136,6 +178,9 @@ class WebCrawler:
         self.visited_urls: Set[str] = set()
         self.url_queue: List[tuple[str, int]] = []  # (url, depth)
         self.semaphore: Optional[asyncio.Semaphore] = None
+        # Per-domain rate limiting state: lock and next allowed monotonic time
+        self._domain_locks: Dict[str, asyncio.Lock] = {}
+        self._domain_next_allowed: Dict[str, float] = {}
         
         # Default user agents
         if not self.config.user_agents:
@@ -144,6 +189,8 @@ class WebCrawler:
                 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
                 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             ]
+        # Round-robin user agent rotation across requests and retries
+        self._ua_cycle = itertools.cycle(self.config.user_agents)
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -156,8 +203,18 @@ class WebCrawler:
     
     async def _initialize(self):
         """Initialize the crawler."""
+        connector = aiohttp.TCPConnector(
+            limit=self.config.conn_limit,
+            limit_per_host=self.config.conn_per_host,
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+            keepalive_timeout=30
+        )
         self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=self.config.timeout)
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.config.timeout),
+            auto_decompress=True
         )
         self.semaphore = asyncio.Semaphore(self.config.max_concurrent_requests)
     
@@ -218,30 +275,20 @@ class WebCrawler:
         """
         links = []
         images = []
+        base = urlsplit(base_url)
         
         # Extract links
-        link_pattern = r'href=["\']([^"\']+)["\']'
-        for match in re.finditer(link_pattern, html_content, re.IGNORECASE):
+        for match in _RE_HREF.finditer(html_content):
             link = match.group(1)
-            if link.startswith(('http://', 'https://')):
-                links.append(link)
-            elif link.startswith('/'):
-                links.append(urljoin(base_url, link))
-            elif not link.startswith(('#', 'mailto:', 'tel:', 'javascript:')):
-                links.append(urljoin(base_url, link))
+            if not link.startswith(('#', 'mailto:', 'tel:', 'javascript:')):
+                links.append(fast_urljoin(base, base_url, link))
         
         # Extract images
-        img_pattern = r'src=["\']([^"\']+)["\']'
-        for match in re.finditer(img_pattern, html_content, re.IGNORECASE):
-            img_src = match.group(1)
-            if img_src.startswith(('http://', 'https://')):
-                images.append(img_src)
-            elif img_src.startswith('/'):
-                images.append(urljoin(base_url, img_src))
-            else:
-                images.append(urljoin(base_url, img_src))
+        for match in _RE_SRC.finditer(html_content):
+            images.append(fast_urljoin(base, base_url, match.group(1)))
         
-        return links, images
+        # Deduplicate while preserving document order
+        return list(dict.fromkeys(links)), list(dict.fromkeys(images))
     
     def _extract_title(self, html_content: str) -> str:
         """
@@ -253,10 +300,34 @@ class WebCrawler:
         Returns:
             Page title
         """
-        title_pattern = r'<title[^>]*>([^<]+)</title>'
-        match = re.search(title_pattern, html_content, re.IGNORECASE)
+        match = _RE_TITLE.search(html_content)
         return match.group(1).strip() if match else ""
     
+    async def _apply_rate_limiting(self, url: str):
+        """
+        Space out requests to the same domain by request_delay (with jitter).
+        
+        Args:
+            url: URL about to be fetched
+        """
+        if self.config.request_delay <= 0:
+            return
+
+        domain = urlparse(url).netloc.lower()
+        lock = self._domain_locks.get(domain)
+        if lock is None:
+            lock = self._domain_locks[domain] = asyncio.Lock()
+
+        async with lock:
+            now = time.monotonic()
+            next_allowed = self._domain_next_allowed.get(domain, 0.0)
+            wait = next_allowed - now
+            if wait > 0:
+                await asyncio.sleep(wait)
+            # add small jitter to avoid patterns
+            delay = self.config.request_delay * (0.5 + random.random())
+            self._domain_next_allowed[domain] = max(now, next_allowed) + delay
+
     def _build_browser_like_headers(self, url: str, user_agent: str, referer: Optional[str] = None) -> Dict[str, str]:
         parsed = urlparse(url)
         origin = f"{parsed.scheme}://{parsed.netloc}"
@@ -264,7 +335,6 @@ class WebCrawler:
             'User-Agent': user_agent,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
             'Sec-Fetch-Dest': 'document',
@@ -272,6 +342,7 @@ class WebCrawler:
             'Sec-Fetch-Site': 'none',
             'Sec-Fetch-User': '?1',
         }
+        # Accept-Encoding is left to aiohttp so it only advertises codecs it can decode
         # Some servers require a referer to not block
         if referer:
             headers['Referer'] = referer
@@ -294,29 +365,35 @@ class WebCrawler:
         Returns:
             CrawledPage object
         """
-        async with self.semaphore:
-            # Rate limiting
-            if self.config.request_delay > 0:
-                # add small jitter to avoid patterns
-                await asyncio.sleep(self.config.request_delay * (0.5 + random.random()))
+        # Per-domain rate limiting happens before taking a slot so that a
+        # throttled domain does not hold up requests to other domains
+        await self._apply_rate_limiting(url)
 
+        async with self.semaphore:
             # Retry loop with header/UA variations
             attempts = max(1, self.config.max_retries)
             last_error: Optional[str] = None
             for attempt in range(attempts):
-                # Rotate user agent per attempt and url
-                ua_index = (hash(url) + attempt + random.randint(0, 1000)) % len(self.config.user_agents)
-                user_agent = self.config.user_agents[ua_index]
+                # Rotate user agent per attempt
+                user_agent = next(self._ua_cycle)
                 headers = self._build_browser_like_headers(url, user_agent)
 
                 try:
                     async with self.session.get(url, headers=headers, allow_redirects=True) as response:
                         if response.status == 200:
-                            content = await response.text()
-
-                            # Check content length
-                            if len(content.encode('utf-8')) > self.config.max_content_length:
-                                content = content[:self.config.max_content_length]
+                            # Skip downloading bodies the scrapers cannot parse (PDFs, images, ...)
+                            # (aiohttp reports octet-stream when the header is absent, so check it first)
+                            raw_content_type = response.headers.get('content-type', '')
+                            if raw_content_type and response.content_type not in _TEXT_CONTENT_TYPES:
+                                return CrawledPage(
+                                    url=url,
+                                    status_code=response.status,
+                                    content_type=raw_content_type,
+                                    depth=depth,
+                                    error=f"Unsupported content type: {response.content_type}"
+                                )
+
+                            content = await self._read_capped_text(response)
 
                             # Extract title, links, and images
                             title = self._extract_title(content)
@@ -369,8 +446,7 @@ class WebCrawler:
 
             # All attempts failed; if 403/429/503 or unknown error and browser fallback is enabled, try browser
             if self.config.enable_browser_fallback:
-                ua_index = (hash(url) + random.randint(0, 1000)) % len(self.config.user_agents)
-                user_agent = self.config.user_agents[ua_index]
+                user_agent = next(self._ua_cycle)
                 browser_page = await self._fetch_with_browser(url, user_agent)
                 if browser_page is not None:
                     return browser_page
@@ -382,6 +458,37 @@ class WebCrawler:
                 error=last_error or "Failed to fetch page after retries"
             )
 
+    async def _read_capped_text(self, response: aiohttp.ClientResponse) -> str:
+        """
+        Stream a response body up to max_content_length bytes and decode it once.
+        
+        Args:
+            response: Response to read
+            
+        Returns:
+            Decoded body text
+        """
+        limit = self.config.max_content_length
+        content_length = response.content_length
+        encoding = response.headers.get('Content-Encoding', 'identity').strip().lower()
+        if content_length is not None and content_length <= limit and encoding in ('', 'identity'):
+            # Uncompressed and the declared size fits: read in one shot.
+            # Compressed bodies always stream, as Content-Length only bounds
+            # the encoded bytes and the decompressed size is unknown
+            buf = (await response.read())[:limit]
+        else:
+            buf = bytearray()
+            async for chunk in response.content.iter_chunked(65536):
+                buf.extend(chunk)
+                if len(buf) > limit:
+                    del buf[limit:]
+                    break
+        try:
+            return buf.decode(response.charset or 'utf-8', errors='ignore')
+        except LookupError:
+            # Unknown charset label from the server
+            return buf.decode('utf-8', errors='ignore')
+
     async def _fetch_with_browser(self, url: str, user_agent: str) -> Optional[CrawledPage]:
         """
         Fetch page using a headless browser (Playwright preferred, Selenium fallback).
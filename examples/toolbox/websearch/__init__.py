@@ -4,7 +4,8 @@ WebSearch Tools Package
 Modular web search implementations with rate limiting protection.
 """
 
-from .base_search import BaseSearchTool
+from .base_search import BaseSearchTool, RateLimitError, HardFailError, QueryCache, canonicalize_query
+from ._http import install_uvloop
 from .duckduckgo_search import DuckDuckGoSearchTool
 from .google_classic_search import GoogleClassicSearchTool
 from .google_selenium_search import GoogleSeleniumSearchTool
@@ -12,6 +13,11 @@ from .googlesearch_python_search import GoogleSearchPythonTool
 
 __all__ = [
     'BaseSearchTool',
+    'RateLimitError',
+    'HardFailError',
+    'QueryCache',
+    'canonicalize_query',
+    'install_uvloop',
     'DuckDuckGoSearchTool', 
     'GoogleClassicSearchTool',
     'GoogleSeleniumSearchTool',
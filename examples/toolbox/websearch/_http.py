@@ -0,0 +1,131 @@
+"""
+Shared HTTP Session
+
+Process-wide aiohttp session shared by the API-based search tools so that
+back-to-back searches reuse pooled keep-alive connections instead of paying
+a fresh TCP/TLS handshake per tool instance.
+"""
+
+import asyncio
+import ssl
+from typing import Dict, Optional
+
+import aiohttp
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    # Not installed, or unsupported platform (Windows)
+    UVLOOP_AVAILABLE = False
+
+from .base_search import ACCEPT_ENCODING
+
+# One TLS context for every connection instead of one per connector
+_SSL_CTX = ssl.create_default_context()
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+_lock: Optional[asyncio.Lock] = None
+
+# Reference counts keyed by session, so releasing a session that has since
+# been replaced never touches its successor's count
+_users: Dict[aiohttp.ClientSession, int] = {}
+
+
+def _session_usable() -> bool:
+    """Check the shared session is open and bound to the running loop."""
+    return (
+        _session is not None
+        and not _session.closed
+        and _session_loop is asyncio.get_running_loop()
+    )
+
+
+def is_current_shared_session(session: aiohttp.ClientSession) -> bool:
+    """Check a previously acquired session is still the usable shared one."""
+    return session is _session and _session_usable()
+
+
+async def _close_session(session: aiohttp.ClientSession):
+    """Close a session, tolerating one bound to an already closed loop."""
+    _users.pop(session, None)
+    if session.closed:
+        return
+    try:
+        await session.close()
+    except Exception:
+        pass
+
+
+async def acquire_shared_session() -> aiohttp.ClientSession:
+    """
+    Get the shared session, creating it on first use.
+    
+    Every call must be paired with release_shared_session(session); the
+    session is closed when its last user releases it. A session left over
+    from another event loop is closed and replaced.
+    """
+    global _session, _session_loop, _lock
+
+    if _lock is None or _session_loop is not asyncio.get_running_loop():
+        _lock = asyncio.Lock()
+
+    async with _lock:
+        if not _session_usable():
+            if _session is not None:
+                await _close_session(_session)
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                # Kept above the tools' own concurrency caps so those stay the
+                # effective throttle and requests never queue inside the connector
+                limit_per_host=20,
+                keepalive_timeout=30,
+                enable_cleanup_closed=True,
+                use_dns_cache=True,
+                ttl_dns_cache=300,
+                ssl=_SSL_CTX
+            )
+            # aiohttp transparently decodes gzip/deflate (and br with brotli installed)
+            _session = aiohttp.ClientSession(
+                connector=connector,
+                auto_decompress=True,
+                headers={
+                    "Accept-Encoding": ACCEPT_ENCODING,
+                    "Connection": "keep-alive"
+                }
+            )
+            _session_loop = asyncio.get_running_loop()
+        _users[_session] = _users.get(_session, 0) + 1
+        return _session
+
+
+async def release_shared_session(session: aiohttp.ClientSession):
+    """Release one reference to a session, closing it when unused."""
+    global _session
+
+    users = _users.get(session)
+    if users is None:
+        # Already closed, e.g. replaced after an event loop change
+        return
+
+    if users > 1:
+        _users[session] = users - 1
+        return
+
+    await _close_session(session)
+    if session is _session:
+        _session = None
+
+
+def install_uvloop() -> bool:
+    """
+    Switch the default event loop policy to uvloop when it is installed.
+
+    Opt-in because the policy is process-wide: call it once before
+    asyncio.run(). Returns True if uvloop was installed.
+    """
+    if not UVLOOP_AVAILABLE:
+        return False
+    uvloop.install()
+    return True
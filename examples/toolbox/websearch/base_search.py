@@ -6,18 +6,58 @@ including rate limiting, retry mechanisms, and result standardization.
 """
 
 import asyncio
+import copy
+import functools
+import json
 import random
+import re
 import time
+import unicodedata
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Any, Optional, Tuple
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import brotli  # noqa: F401 - lets aiohttp decode "br" responses
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Only advertise Brotli when aiohttp can actually decode it
+ACCEPT_ENCODING = "gzip, deflate, br" if BROTLI_AVAILABLE else "gzip, deflate"
+
+# Internal timing (cache TTLs, token buckets) uses the monotonic clock; wall-clock
+# time is reserved for human-facing metadata and HTTP-date parsing
+_now = time.monotonic
+
+# Decode JSON straight from response bytes, using orjson's C parser when installed
+json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from workflown.core.tools.base_tool import BaseTool, ToolResult, ToolCapability
+from workflown.core.logging.logger import LogLevel
+
+_RATE_LIMIT_RE = re.compile(
+    r"429|too many requests|rate limit|quota exceeded|throttled|service unavailable|"
+    r"503|temporarily blocked|blocked|captcha|bot detected",
+    re.IGNORECASE
+)
+
+# Fallback for untyped errors that retrying the same backend will not fix
+# (e.g. IP blocks); known 403 responses raise HardFailError instead
+_HARD_FAIL_RE = re.compile(r"\b403\b|access forbidden|ip blocking", re.IGNORECASE)
 
 
 class SearchResult:
@@ -48,18 +88,92 @@ class SearchResult:
         }
 
 
+@functools.lru_cache(maxsize=4096)
+def canonicalize_query(query: str) -> str:
+    """
+    Normalize a query for cache keys: NFKC-fold, lowercase, collapse whitespace, drop trailing ?.!
+    
+    This only widens exact-match caching; it is not a semantic cache.
+    """
+    return " ".join(unicodedata.normalize("NFKC", query).lower().split()).rstrip("?.!")
+
+
+class QueryCache:
+    """Small in-process LRU cache with a per-entry TTL."""
+    
+    def __init__(self, max_size: int = 256, ttl: float = 600.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: Any) -> Any:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        stored_at, value = entry
+        if _now() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    def put(self, key: Any, value: Any):
+        """Store a value, evicting the least recently used entries if full."""
+        if self.max_size <= 0:
+            return
+        self._entries[key] = (_now(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Drop all cached entries."""
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RateLimitError(Exception):
+    """Raised when a search backend signals rate limiting (e.g. 429/503)."""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None, status: Optional[int] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.status = status
+
+
+class HardFailError(Exception):
+    """Raised when retrying the same backend cannot help (e.g. a blocked API)."""
+    
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
 class BaseSearchTool(BaseTool, ABC):
     """
     Abstract base class for web search tools with rate limiting protection.
     
     Provides common functionality:
-    - Intelligent request throttling
-    - Exponential backoff retry mechanism  
+    - Intelligent per-host token-bucket throttling
+    - Decorrelated-jitter backoff retry mechanism
     - User agent rotation
-    - Request history tracking
     - Standardized result format
+    
+    Subclasses set ``rate_limit_host`` so tools hitting the same host share
+    one token bucket.
     """
     
+    # Host used as the token-bucket key (defaults to the tool name)
+    rate_limit_host: Optional[str] = None
+    
+    # Per-host token buckets shared by all search tools: host -> (tokens, last_refill)
+    _rate_buckets: Dict[str, Tuple[float, float]] = {}
+    
     def __init__(
         self,
         tool_id: str,
@@ -79,13 +193,24 @@ class BaseSearchTool(BaseTool, ABC):
         # Rate limiting configuration
         self.rate_limit_delay = self.config.get("rate_limit_delay", 1.0)
         self.max_retries = self.config.get("max_retries", 3)
-        self.exponential_backoff_base = self.config.get("exponential_backoff_base", 2.0)
         self.max_backoff_delay = self.config.get("max_backoff_delay", 30.0)
         self.jitter_range = self.config.get("jitter_range", 0.1)
+        self.hard_fail_threshold = self.config.get("hard_fail_threshold", 3)
+        self.max_response_bytes = self.config.get("max_response_bytes", 2 * 1024 * 1024)
+        
+        # Result caching (exact match on the canonicalized query)
+        self.cache_ttl = self.config.get("cache_ttl", 600)
+        self.cache_size = self.config.get("cache_size", 256)
+        self.normalize_query = self.config.get("normalize_query", True)
+        self._result_cache = QueryCache(max_size=self.cache_size, ttl=self.cache_ttl)
+        
+        # Searches in flight on this instance (so on its engine config and
+        # cache): cache key -> task
+        self._inflight: Dict[Any, "asyncio.Task"] = {}
+        
+        self.rate_limit_burst = self.config.get("rate_limit_burst", 2.0)
         
         # Request tracking
-        self.request_history = []
-        self.last_request_time = None
         self.consecutive_failures = 0
         
         # User agent rotation
@@ -103,6 +228,55 @@ class BaseSearchTool(BaseTool, ABC):
         """Initialize tool-specific components. Override in subclasses."""
         pass
     
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+        if not value:
+            return None
+        value = value.strip()
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    
+    def _raise_for_transient_status(self, status: int, headers, service: str):
+        """Raise RateLimitError (carrying Retry-After) for 429 and 5xx responses."""
+        if status == 429 or 500 <= status < 600:
+            raise RateLimitError(
+                f"{service} temporarily unavailable ({status})",
+                retry_after=self._parse_retry_after(headers.get("Retry-After")),
+                status=status
+            )
+    
+    async def _read_response_body(self, response) -> bytes:
+        """Read an aiohttp response body, refusing anything above max_response_bytes."""
+        return await self._read_limited(
+            response.content.iter_chunked(64 * 1024),
+            response.content_length
+        )
+    
+    async def _read_limited(self, chunks, content_length: Optional[int] = None) -> bytes:
+        """Collect an async stream of byte chunks, failing once it exceeds max_response_bytes."""
+        limit = self.max_response_bytes
+        if content_length and content_length > limit:
+            raise Exception(f"Response too large ({content_length} bytes, limit {limit})")
+        
+        parts = []
+        size = 0
+        async for chunk in chunks:
+            size += len(chunk)
+            if size > limit:
+                raise Exception(f"Response exceeded size limit of {limit} bytes")
+            parts.append(chunk)
+        return b"".join(parts)
+    
     def get_random_user_agent(self) -> str:
         """Get a random user agent string."""
         return random.choice(self.user_agents)
@@ -134,29 +308,44 @@ class BaseSearchTool(BaseTool, ABC):
         language = parameters.get("language", "en")
         region = parameters.get("region", "US")
         
-        await self._log_info(
-            f"Starting search",
-            query=query,
-            max_results=max_results,
-            language=language,
-            region=region
+        # Cache hits skip throttling, the network and logging entirely
+        cache_key = (
+            canonicalize_query(query) if self.normalize_query else query,
+            max_results,
+            language,
+            region
         )
+        # Every consumer gets its own copy, so mutating a returned result
+        # never changes the cached entry or another caller's results
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            return ToolResult(
+                tool_id=self.tool_id,
+                success=True,
+                result=copy.deepcopy(cached),
+                metadata={
+                    "query": query,
+                    "results_count": len(cached),
+                    "max_results": max_results,
+                    "language": language,
+                    "region": region,
+                    "search_engine": self.name,
+                    "cached": True
+                }
+            )
+        
+        # Identical concurrent searches on this tool wait on the one already in flight
+        pending = self._inflight.get(cache_key)
+        if pending is None or pending.get_loop() is not asyncio.get_running_loop():
+            pending = asyncio.ensure_future(
+                self._fetch_results(query, max_results, language, region, cache_key)
+            )
+            self._inflight[cache_key] = pending
+            pending.add_done_callback(functools.partial(self._inflight_done, cache_key))
         
         try:
-            # Apply intelligent throttling
-            await self._apply_intelligent_throttling()
-            
-            # Perform search with retry mechanism
-            results = await self._search_with_retry(query, max_results, language, region)
-            #print("------------------------------  SEARCH RESULTS ------------------------------")
-            #print(f"results: {results}")
-            #print("----------------------------------------------------------------------------")
-            
-            # Convert SearchResult objects to dictionaries
-            result_dicts = [r.to_dict() if isinstance(r, SearchResult) else r for r in results]
-            #print("------------------------------  RESULT DICTS ------------------------------")
-            #print(f"result_dicts: {result_dicts}")
-            #print("----------------------------------------------------------------------------")
+            # Shielded so one cancelled caller does not abort the shared search
+            result_dicts = copy.deepcopy(await asyncio.shield(pending))
             
             return ToolResult(
                 tool_id=self.tool_id,
@@ -164,7 +353,7 @@ class BaseSearchTool(BaseTool, ABC):
                 result=result_dicts,
                 metadata={
                     "query": query,
-                    "results_count": len(results),
+                    "results_count": len(result_dicts),
                     "max_results": max_results,
                     "language": language,
                     "region": region,
@@ -183,42 +372,72 @@ class BaseSearchTool(BaseTool, ABC):
                 errors=[str(e)]
             )
     
-    async def _apply_intelligent_throttling(self):
-        """Apply intelligent throttling based on request history and failures."""
-        current_time = datetime.now()
-        
-        # Clean old request history (keep last hour)
-        cutoff_time = current_time - timedelta(hours=1)
-        self.request_history = [req_time for req_time in self.request_history if req_time > cutoff_time]
-        
-        # Calculate dynamic delay based on request frequency and consecutive failures
-        requests_per_minute = len([
-            req_time for req_time in self.request_history 
-            if req_time > current_time - timedelta(minutes=1)
-        ])
+    def _inflight_done(self, cache_key: Any, task: "asyncio.Task"):
+        """Forget a finished shared search and retrieve its outcome."""
+        if self._inflight.get(cache_key) is task:
+            del self._inflight[cache_key]
+        if not task.cancelled():
+            # Marks the exception as retrieved even if every waiter was cancelled
+            task.exception()
+    
+    async def _fetch_results(
+        self,
+        query: str,
+        max_results: int,
+        language: str,
+        region: str,
+        cache_key: Any
+    ) -> List[Dict[str, Any]]:
+        """Throttle, search with retries and cache the results as dictionaries."""
+        await self._log_info(
+            f"Starting search",
+            query=query,
+            max_results=max_results,
+            language=language,
+            region=region
+        )
         
-        # Base delay increases with consecutive failures
-        base_delay = self.rate_limit_delay * (1 + self.consecutive_failures * 0.3)
+        # Apply intelligent throttling
+        await self._apply_intelligent_throttling()
         
-        # Additional delay if too many requests per minute
-        if requests_per_minute > 6:
-            base_delay *= (requests_per_minute / 6)
+        # Perform search with retry mechanism
+        results = await self._search_with_retry(query, max_results, language, region)
         
-        # Add jitter to avoid thundering herd
-        jitter = random.uniform(-self.jitter_range, self.jitter_range) * base_delay
-        total_delay = max(0, base_delay + jitter)
+        # Convert SearchResult objects to dictionaries
+        result_dicts = [r.to_dict() if isinstance(r, SearchResult) else r for r in results]
+        self._result_cache.put(cache_key, result_dicts)
+        return result_dicts
+    
+    async def _apply_intelligent_throttling(self):
+        """Throttle via the host's token bucket; the refill rate drops as failures mount."""
+        # Effective delay between requests increases with consecutive failures
+        delay = self.rate_limit_delay * (1 + self.consecutive_failures * 0.3)
+        if delay <= 0:
+            return
         
-        # Respect minimum time between requests
-        if self.last_request_time:
-            time_since_last = (current_time - self.last_request_time).total_seconds()
-            if time_since_last < total_delay:
-                await asyncio.sleep(total_delay - time_since_last)
-        else:
-            await asyncio.sleep(total_delay)
+        await self._acquire(
+            self.rate_limit_host or self.name,
+            rate=1.0 / delay,
+            burst=self.rate_limit_burst
+        )
+    
+    async def _acquire(self, host: str, rate: float, burst: float):
+        """Take one token from the host's bucket, sleeping only as long as needed."""
+        buckets = BaseSearchTool._rate_buckets
         
-        # Record request time
-        self.request_history.append(current_time)
-        self.last_request_time = current_time
+        while True:
+            now = _now()
+            tokens, last_refill = buckets.get(host, (burst, now))
+            tokens = min(burst, tokens + (now - last_refill) * rate)
+            
+            if tokens >= 1:
+                buckets[host] = (tokens - 1, now)
+                return
+            
+            buckets[host] = (tokens, now)
+            # Jitter the wait so concurrent callers don't wake in lockstep
+            wait = (1 - tokens) / rate
+            await asyncio.sleep(wait * (1 + random.uniform(0, self.jitter_range)))
     
     async def _search_with_retry(
         self,
@@ -227,8 +446,16 @@ class BaseSearchTool(BaseTool, ABC):
         language: str,
         region: str
     ) -> List[SearchResult]:
-        """Perform search with exponential backoff retry mechanism."""
+        """
+        Perform search with decorrelated-jitter backoff retry mechanism.
+        
+        Each retry sleeps for a random duration between the base delay and a
+        multiple of the previous sleep (capped at max_backoff_delay), so that
+        clients hit by the same rate-limit wave do not retry in lockstep. A
+        Retry-After longer than max_backoff_delay ends the retries instead.
+        """
         last_exception = None
+        prev_sleep = self.rate_limit_delay
         
         for attempt in range(self.max_retries):
             try:
@@ -254,44 +481,63 @@ class BaseSearchTool(BaseTool, ABC):
                     consecutive_failures=self.consecutive_failures
                 )
                 
+                if self._is_hard_fail_error(e) or (
+                    is_rate_limit and self.consecutive_failures > self.hard_fail_threshold
+                ):
+                    # Retrying will not help; give up now instead of sleeping
+                    await self._log_warning(
+                        "Hard failure detected, skipping remaining retries",
+                        query=query,
+                        consecutive_failures=self.consecutive_failures
+                    )
+                    break
+                
                 if attempt < self.max_retries - 1:
-                    if is_rate_limit:
-                        # Longer delay for rate limit errors  
-                        delay = min(
-                            self.exponential_backoff_base ** (attempt + 2),
-                            self.max_backoff_delay
+                    if isinstance(e, RateLimitError) and e.retry_after is not None:
+                        # Server told us exactly how long to wait
+                        if e.retry_after > self.max_backoff_delay:
+                            await self._log_warning(
+                                "Retry-After exceeds max_backoff_delay, giving up",
+                                query=query,
+                                retry_after=e.retry_after
+                            )
+                            break
+                        prev_sleep = min(
+                            self.max_backoff_delay,
+                            e.retry_after * (1 + random.uniform(0, self.jitter_range))
                         )
                     else:
-                        # Standard exponential backoff
-                        delay = min(
-                            self.exponential_backoff_base ** attempt,
-                            self.max_backoff_delay
+                        # Rate limit errors widen the window more aggressively
+                        multiplier = 5 if is_rate_limit else 3
+                        prev_sleep = min(
+                            self.max_backoff_delay,
+                            random.uniform(self.rate_limit_delay, prev_sleep * multiplier)
                         )
                     
-                    # Add jitter
-                    jitter = random.uniform(0.1, 0.3) * delay
-                    total_delay = delay + jitter
-                    
                     await self._log_info(
-                        f"Retrying in {total_delay:.2f} seconds",
+                        f"Retrying in {prev_sleep:.2f} seconds",
                         attempt=attempt + 1,
-                        delay=total_delay
+                        delay=prev_sleep
                     )
                     
-                    await asyncio.sleep(total_delay)
+                    await asyncio.sleep(prev_sleep)
         
         # All attempts failed
         raise last_exception or Exception("All search attempts failed")
     
     def _is_rate_limit_error(self, error: Exception) -> bool:
         """Check if error indicates rate limiting."""
-        error_str = str(error).lower()
-        rate_limit_indicators = [
-            "429", "too many requests", "rate limit", "quota exceeded",
-            "throttled", "service unavailable", "503", "temporarily blocked",
-            "blocked", "captcha", "bot detected"
-        ]
-        return any(indicator in error_str for indicator in rate_limit_indicators)
+        if isinstance(error, RateLimitError):
+            return True
+        return bool(_RATE_LIMIT_RE.search(str(error)))
+    
+    def _is_hard_fail_error(self, error: Exception) -> bool:
+        """Check if error indicates a block that retries cannot recover from."""
+        if isinstance(error, HardFailError):
+            return True
+        if isinstance(error, RateLimitError):
+            return False
+        return bool(_HARD_FAIL_RE.search(str(error)))
     
     @abstractmethod
     async def _perform_search(
@@ -325,9 +571,9 @@ class BaseSearchTool(BaseTool, ABC):
     
     # Logging helpers
     async def _log_info(self, message: str, **kwargs):
-        """Log info message."""
-        if hasattr(self, 'logger'):
-            await self.logger.info(message, tool_id=self.tool_id, **kwargs)
+        """Log info message without blocking the search on handler I/O."""
+        if hasattr(self, 'logger') and self.logger.is_enabled_for(LogLevel.INFO):
+            self.logger.info_sync(message, tool_id=self.tool_id, **kwargs)
     
     async def _log_warning(self, message: str, **kwargs):
         """Log warning message."""
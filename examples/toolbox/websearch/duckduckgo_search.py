@@ -6,12 +6,26 @@ DuckDuckGo doesn't require API keys and is more lenient with rate limiting.
 """
 
 import aiohttp
-import json
 import re
 from typing import List
 from urllib.parse import quote_plus
 
-from .base_search import BaseSearchTool, SearchResult
+from yarl import URL
+
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+from .base_search import BaseSearchTool, SearchResult, RateLimitError, HardFailError, ACCEPT_ENCODING, json_loads
+from ._http import acquire_shared_session, is_current_shared_session, release_shared_session
+
+# Precompiled patterns for the regex-based HTML fallback parser
+_RESULT_BODY_RE = re.compile(r'<div class="result__body".*?>(.*?)</div>\s*</div>', re.DOTALL)
+_RESULT_TITLE_RE = re.compile(r'<a rel="nofollow" href="([^"]*)"[^>]*class="result__a"[^>]*>(.*?)</a>')
+_RESULT_SNIPPET_RE = re.compile(r'<a[^>]*class="result__snippet"[^>]*>(.*?)</a>')
+_TAG_RE = re.compile(r'<[^>]*>')
 
 
 class DuckDuckGoSearchTool(BaseSearchTool):
@@ -22,6 +36,8 @@ class DuckDuckGoSearchTool(BaseSearchTool):
     if no results are found. DuckDuckGo is generally more forgiving with rate limits.
     """
     
+    rate_limit_host = "duckduckgo.com"
+    
     def __init__(self, tool_id: str = None, config: dict = None):
         super().__init__(
             tool_id=tool_id or "duckduckgo_search",
@@ -30,26 +46,35 @@ class DuckDuckGoSearchTool(BaseSearchTool):
             config=config
         )
         self.session = None
+        self.request_timeout = aiohttp.ClientTimeout(total=30)
+        
+        # Fixed instant answer parameters are encoded once; only "q" varies per call
+        self._instant_answer_base = URL("https://api.duckduckgo.com/").with_query({
+            "format": "json",
+            "no_html": "1",
+            "skip_disambig": "1",
+            "no_redirect": "1",
+            "t": "workflown"
+        })
+        self.default_headers = {
+            "User-Agent": self.get_random_user_agent(),
+            "Accept": "application/json,text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.5",
+            "Accept-Encoding": ACCEPT_ENCODING,
+            "Connection": "keep-alive",
+            "Upgrade-Insecure-Requests": "1"
+        }
     
     def _initialize(self):
         """Initialize HTTP session."""
         pass
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session."""
-        if self.session is None or self.session.closed:
-            timeout = aiohttp.ClientTimeout(total=30)
-            self.session = aiohttp.ClientSession(
-                timeout=timeout,
-                headers={
-                    "User-Agent": self.get_random_user_agent(),
-                    "Accept": "application/json,text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.5",
-                    "Accept-Encoding": "gzip, deflate",
-                    "Connection": "keep-alive",
-                    "Upgrade-Insecure-Requests": "1"
-                }
-            )
+        """Get the process-wide shared HTTP session, re-acquiring it after a loop change."""
+        if self.session is None or not is_current_shared_session(self.session):
+            if self.session is not None:
+                await release_shared_session(self.session)
+            self.session = await acquire_shared_session()
         return self.session
     
     async def _perform_search(
@@ -66,8 +91,12 @@ class DuckDuckGoSearchTool(BaseSearchTool):
         """
         session = await self._get_session()
         
-        # Try instant answer API first
-        results = await self._search_instant_answer(session, query, max_results)
+        # Try instant answer API first; if it is throttled, go straight to HTML
+        try:
+            results = await self._search_instant_answer(session, query, max_results)
+        except RateLimitError as e:
+            await self._log_warning("DuckDuckGo instant answer API throttled", error=str(e))
+            results = []
         
         if results:
             await self._log_info(
@@ -79,15 +108,7 @@ class DuckDuckGoSearchTool(BaseSearchTool):
         
         # Fallback to HTML search
         await self._log_info(f"Falling back to DuckDuckGo HTML search", query=query)
-        results = await self._search_html(session, query, max_results, language, region)
-        
-        await self._log_info(
-            f"DuckDuckGo HTML search completed",
-            query=query,
-            results_count=len(results)
-        )
-        
-        return results
+        return await self._search_html(session, query, max_results, language, region)
     
     async def _search_instant_answer(
         self,
@@ -96,30 +117,33 @@ class DuckDuckGoSearchTool(BaseSearchTool):
         max_results: int
     ) -> List[SearchResult]:
         """Search using DuckDuckGo instant answer API."""
-        params = {
-            "q": query,
-            "format": "json",
-            "no_html": "1",
-            "skip_disambig": "1",
-            "no_redirect": "1",
-            "t": "workflown"
-        }
+        url = self._instant_answer_base.update_query(q=query)
         
         try:
-            async with session.get("https://api.duckduckgo.com/", params=params) as response:
+            async with session.get(
+                url,
+                headers=self.default_headers,
+                timeout=self.request_timeout
+            ) as response:
                 if response.status == 200:
-                    content = await response.text()
+                    # DDG serves JSON as application/x-javascript, so decode the raw bytes
+                    body = await self._read_response_body(response)
                     try:
-                        data = json.loads(content)
-                        return self._parse_instant_answer_results(data, max_results)
-                    except json.JSONDecodeError:
+                        data = json_loads(body)
+                    except ValueError:
                         await self._log_warning("Failed to parse DuckDuckGo JSON response")
                         return []
-                elif response.status == 429:
-                    raise Exception("DuckDuckGo rate limit exceeded (429)")
-                elif response.status == 503:
-                    raise Exception("DuckDuckGo service unavailable (503)")
+                    return self._parse_instant_answer_results(data, max_results)
+                elif response.status in (429, 503):
+                    reason = "rate limit exceeded" if response.status == 429 else "service unavailable"
+                    raise RateLimitError(
+                        f"DuckDuckGo {reason} ({response.status})",
+                        retry_after=self._parse_retry_after(response.headers.get("Retry-After")),
+                        status=response.status
+                    )
                 else:
+                    # Remaining 5xx responses are transient and worth retrying
+                    self._raise_for_transient_status(response.status, response.headers, "DuckDuckGo API")
                     raise Exception(f"DuckDuckGo API failed with status {response.status}")
                     
         except aiohttp.ClientError as e:
@@ -149,7 +173,7 @@ class DuckDuckGoSearchTool(BaseSearchTool):
             "User-Agent": self.get_random_user_agent(),
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
             "Accept-Language": f"{language}-{region},{language};q=0.5",
-            "Accept-Encoding": "gzip, deflate",
+            "Accept-Encoding": ACCEPT_ENCODING,
             "Content-Type": "application/x-www-form-urlencoded",
             "Origin": "https://html.duckduckgo.com",
             "Connection": "keep-alive",
@@ -158,15 +182,24 @@ class DuckDuckGoSearchTool(BaseSearchTool):
         }
         
         try:
-            async with session.post(search_url, data=data, headers=headers) as response:
+            async with session.post(
+                search_url, data=data, headers=headers, timeout=self.request_timeout
+            ) as response:
                 if response.status == 200:
-                    content = await response.text()
+                    body = await self._read_response_body(response)
+                    content = body.decode(response.charset or "utf-8", errors="replace")
                     return self._parse_html_results(content, max_results)
                 elif response.status == 429:
-                    raise Exception("DuckDuckGo rate limit exceeded (429)")
+                    raise RateLimitError(
+                        "DuckDuckGo rate limit exceeded (429)",
+                        retry_after=self._parse_retry_after(response.headers.get("Retry-After")),
+                        status=429
+                    )
                 elif response.status == 403:
-                    raise Exception("DuckDuckGo access forbidden - possible IP blocking (403)")
+                    raise HardFailError("DuckDuckGo access forbidden - possible IP blocking (403)", status=403)
                 else:
+                    # Remaining 5xx responses are transient and worth retrying
+                    self._raise_for_transient_status(response.status, response.headers, "DuckDuckGo HTML search")
                     raise Exception(f"DuckDuckGo HTML search failed with status {response.status}")
                     
         except aiohttp.ClientError as e:
@@ -197,13 +230,17 @@ class DuckDuckGoSearchTool(BaseSearchTool):
             ))
         
         # Extract related topics
+        append = results.append
         for i, topic in enumerate(data.get("RelatedTopics", [])[:max_results-len(results)]):
-            if isinstance(topic, dict) and topic.get("Text"):
-                results.append(SearchResult(
-                    title=topic.get("Text", "")[:100],
+            if not isinstance(topic, dict):
+                continue
+            text = topic.get("Text")
+            if text:
+                append(SearchResult(
+                    title=text[:100],
                     url=topic.get("FirstURL", ""),
-                    snippet=topic.get("Text", "")[:300],
-                    relevance=0.7 - (i * 0.05),
+                    snippet=text[:300],
+                    relevance=max(0.0, 0.7 - (i * 0.05)),
                     metadata={"source": "related_topic"}
                 ))
         
@@ -221,33 +258,34 @@ class DuckDuckGoSearchTool(BaseSearchTool):
     
     def _parse_html_results(self, content: str, max_results: int) -> List[SearchResult]:
         """Parse DuckDuckGo HTML search results."""
-        results = []
+        if SELECTOLAX_AVAILABLE:
+            return self._parse_html_results_selectolax(content, max_results)
         
-        # Look for result containers
-        result_pattern = r'<div class="result__body".*?>(.*?)</div>\s*</div>'
-        result_matches = re.findall(result_pattern, content, re.DOTALL)
+        results = []
         
-        for i, result_html in enumerate(result_matches[:max_results]):
+        # Stream result containers and stop once enough have been seen
+        for i, result_match in enumerate(_RESULT_BODY_RE.finditer(content)):
+            if i >= max_results:
+                break
+            result_html = result_match.group(1)
             try:
                 # Extract title and URL
-                title_pattern = r'<a rel="nofollow" href="([^"]*)"[^>]*class="result__a"[^>]*>(.*?)</a>'
-                title_match = re.search(title_pattern, result_html)
+                title_match = _RESULT_TITLE_RE.search(result_html)
                 
                 if title_match:
                     url = title_match.group(1)
-                    title = re.sub(r'<[^>]*>', '', title_match.group(2)).strip()
+                    title = _TAG_RE.sub('', title_match.group(2)).strip()
                     
                     # Extract snippet
-                    snippet_pattern = r'<a[^>]*class="result__snippet"[^>]*>(.*?)</a>'
-                    snippet_match = re.search(snippet_pattern, result_html)
+                    snippet_match = _RESULT_SNIPPET_RE.search(result_html)
                     snippet = ""
                     
                     if snippet_match:
-                        snippet = re.sub(r'<[^>]*>', '', snippet_match.group(1)).strip()
+                        snippet = _TAG_RE.sub('', snippet_match.group(1)).strip()
                     
                     # Fallback snippet extraction
                     if not snippet:
-                        snippet_text = re.sub(r'<[^>]*>', ' ', result_html)
+                        snippet_text = _TAG_RE.sub(' ', result_html)
                         snippet = ' '.join(snippet_text.split())[:200]
                     
                     if title and url:
@@ -255,7 +293,7 @@ class DuckDuckGoSearchTool(BaseSearchTool):
                             title=title[:150],
                             url=url,
                             snippet=snippet[:300],
-                            relevance=0.8 - (i * 0.05),
+                            relevance=max(0.0, 0.8 - (i * 0.05)),
                             metadata={"source": "html_search", "position": i + 1}
                         ))
                             
@@ -266,7 +304,38 @@ class DuckDuckGoSearchTool(BaseSearchTool):
         
         return results
     
+    def _parse_html_results_selectolax(self, content: str, max_results: int) -> List[SearchResult]:
+        """Parse DuckDuckGo HTML search results with selectolax's C parser."""
+        results = []
+        
+        for i, body in enumerate(HTMLParser(content).css("div.result__body")[:max_results]):
+            link = body.css_first("a.result__a")
+            if link is None:
+                continue
+            
+            url = link.attributes.get("href") or ""
+            title = link.text(strip=True)
+            
+            snippet_node = body.css_first(".result__snippet")
+            snippet = snippet_node.text(strip=True) if snippet_node is not None else ""
+            
+            # Fallback snippet extraction
+            if not snippet:
+                snippet = " ".join(body.text(separator=" ").split())[:200]
+            
+            if title and url:
+                results.append(SearchResult(
+                    title=title[:150],
+                    url=url,
+                    snippet=snippet[:300],
+                    relevance=max(0.0, 0.8 - (i * 0.05)),
+                    metadata={"source": "html_search", "position": i + 1}
+                ))
+        
+        return results
+    
     async def cleanup(self):
         """Clean up resources."""
-        if self.session and not self.session.closed:
-            await self.session.close()
\ No newline at end of file
+        if self.session is not None:
+            session, self.session = self.session, None
+            await release_shared_session(session)
\ No newline at end of file
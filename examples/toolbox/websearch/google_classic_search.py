@@ -6,10 +6,30 @@ Requires API keys and has strict rate limiting.
 """
 
 import aiohttp
+import asyncio
 import os
-from typing import List, Optional
+import time
+from typing import Dict, List, Optional
 
-from .base_search import BaseSearchTool, SearchResult
+try:
+    import httpx
+    import h2  # noqa: F401 - required for httpx HTTP/2 support
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+from yarl import URL
+
+from .base_search import BaseSearchTool, SearchResult, RateLimitError, HardFailError, ACCEPT_ENCODING, json_loads
+from ._http import acquire_shared_session, is_current_shared_session, release_shared_session
+
+# Per-API request timeouts; tight connect/read limits keep a slow endpoint
+# from holding pooled connections
+_GOOGLE_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=3, sock_read=8)
+_SERP_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=3, sock_read=12)
+
+# Position-based relevance (0.95, 0.90, ... floored at 0.0), computed once
+_RELEVANCES = tuple(max(0.0, 0.95 - (i * 0.05)) for i in range(100))
 
 
 class GoogleClassicSearchTool(BaseSearchTool):
@@ -24,6 +44,10 @@ class GoogleClassicSearchTool(BaseSearchTool):
     - google_cse_id: Google Custom Search Engine ID  
     - serpapi_key: SerpAPI key (alternative to Google API)
     - preferred_api: "google" or "serpapi" (default: "google")
+    - use_http2: Multiplex SerpAPI calls over HTTP/2 via httpx (default: False)
+    - max_concurrency: Maximum concurrent API requests (default: 10)
+    - api_cooldown: Seconds to skip an API after 429/402/403 (default: 300)
+    - race_apis: Query both APIs at once and keep the first success (default: False)
     """
     
     def __init__(self, tool_id: str = None, config: dict = None):
@@ -52,22 +76,93 @@ class GoogleClassicSearchTool(BaseSearchTool):
                 "Set via config dict or environment variables."
             )
         
+        # API dispatch table and try-order (preferred API first)
+        self._api_dispatch = {
+            "google": self._search_google_api,
+            "serpapi": self._search_serpapi
+        }
+        self._api_order = [
+            api for api, enabled in (("google", self.use_google_api), ("serpapi", self.use_serpapi))
+            if enabled
+        ]
+        if self.preferred_api in self._api_order:
+            self._api_order.remove(self.preferred_api)
+            self._api_order.insert(0, self.preferred_api)
+        
+        # Throttle against whichever API is tried first
+        self.rate_limit_host = "serpapi.com" if self._api_order[0] == "serpapi" else "www.googleapis.com"
+        
+        # Per-API base URLs with the invariant query parameters pre-encoded
+        if self.use_google_api:
+            self._google_api_base = URL("https://www.googleapis.com/customsearch/v1").with_query({
+                "key": self.google_api_key,
+                "cx": self.google_cse_id,
+                "safe": "off",
+                "searchType": "text"
+            })
+        if self.use_serpapi:
+            self._serpapi_base = URL("https://serpapi.com/search").with_query({
+                "api_key": self.serpapi_key,
+                "engine": "google",
+                "safe": "off",
+                "format": "json"
+            })
+        
+        # Optional HTTP/2 client so concurrent SerpAPI calls share one connection
+        self.use_http2 = self.config.get("use_http2", False) and HTTPX_AVAILABLE
+        self._http2_client = None
+        
+        # APIs that recently answered 429/402/403, mapped to when they may be tried again
+        self.api_cooldown = self.config.get("api_cooldown", 300)
+        self._api_blocked_until: Dict[str, float] = {}
+        
+        # Cap on in-flight API requests (kept below the connector's per-host limit)
+        self.max_concurrency = self.config.get("max_concurrency", 10)
+        self._api_semaphore: Optional[asyncio.Semaphore] = None
+        
+        # Trade one extra API call per search for the faster API's latency
+        self.race_apis = self.config.get("race_apis", False) and len(self._api_order) > 1
+        
         self.session = None
+        self.default_headers = {
+            "User-Agent": self.get_random_user_agent(),
+            "Accept-Encoding": ACCEPT_ENCODING
+        }
     
     def _initialize(self):
         """Initialize HTTP session."""
         pass
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session."""
-        if self.session is None or self.session.closed:
-            timeout = aiohttp.ClientTimeout(total=45)
-            self.session = aiohttp.ClientSession(
-                timeout=timeout,
-                headers={"User-Agent": self.get_random_user_agent()}
-            )
+        """Get the process-wide shared HTTP session, re-acquiring it after a loop change."""
+        if self.session is None or not is_current_shared_session(self.session):
+            if self.session is not None:
+                await release_shared_session(self.session)
+            self.session = await acquire_shared_session()
         return self.session
     
+    def _get_api_semaphore(self) -> asyncio.Semaphore:
+        """Get the semaphore bounding concurrent API requests, creating it on first use."""
+        if self._api_semaphore is None:
+            self._api_semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._api_semaphore
+    
+    def _block_api(self, api: str, retry_after: Optional[float] = None):
+        """Skip an API for the cooldown (or Retry-After) after a quota/auth failure."""
+        self._api_blocked_until[api] = time.monotonic() + (
+            retry_after if retry_after is not None else self.api_cooldown
+        )
+    
+    def _check_api_available(self, api: str, label: str):
+        """Fail fast, without a network round trip, while an API is cooling down."""
+        blocked_until = self._api_blocked_until.get(api)
+        if blocked_until is not None:
+            remaining = blocked_until - time.monotonic()
+            if remaining > 0:
+                # A hard fail, so the retry loop does not sleep and retry a known-blocked API
+                raise HardFailError(f"{label} temporarily skipped after a recent quota/auth error ({remaining:.0f}s left)")
+            del self._api_blocked_until[api]
+    
     async def _perform_search(
         self,
         query: str,
@@ -80,29 +175,49 @@ class GoogleClassicSearchTool(BaseSearchTool):
         
         Tries preferred API first, then falls back to alternative if available.
         """
-        # Determine which API to try first
-        if self.preferred_api == "serpapi" and self.use_serpapi:
+        if not self._api_order:
+            raise Exception("No valid API configuration available")
+        
+        if self.race_apis:
+            return await self._race_apis(query, max_results, language, region)
+        
+        for api, next_api in zip(self._api_order, self._api_order[1:] + [None]):
             try:
-                return await self._search_serpapi(query, max_results, language, region)
+                return await self._api_dispatch[api](query, max_results, language, region)
             except Exception as e:
-                if self.use_google_api:
-                    await self._log_warning(f"SerpAPI failed, trying Google API", error=str(e))
-                    return await self._search_google_api(query, max_results, language, region)
-                raise
-        else:
-            # Default to Google API first
-            if self.use_google_api:
-                try:
-                    return await self._search_google_api(query, max_results, language, region)
-                except Exception as e:
-                    if self.use_serpapi:
-                        await self._log_warning(f"Google API failed, trying SerpAPI", error=str(e))
-                        return await self._search_serpapi(query, max_results, language, region)
+                if next_api is None:
                     raise
-            elif self.use_serpapi:
-                return await self._search_serpapi(query, max_results, language, region)
-            else:
-                raise Exception("No valid API configuration available")
+                await self._log_warning(f"{api} search failed, trying {next_api}", error=str(e))
+    
+    async def _race_apis(
+        self,
+        query: str,
+        max_results: int,
+        language: str,
+        region: str
+    ) -> List[SearchResult]:
+        """Run every API concurrently and return the first successful result."""
+        tasks = {
+            asyncio.create_task(self._api_dispatch[api](query, max_results, language, region)): api
+            for api in self._api_order
+        }
+        pending = set(tasks)
+        last_error = None
+        
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Prefer the preferred API when several finish together
+                for task in sorted(done, key=lambda t: self._api_order.index(tasks[t])):
+                    error = task.exception()
+                    if error is None:
+                        return task.result()
+                    last_error = error
+                    await self._log_warning(f"{tasks[task]} search failed during API race", error=str(error))
+            raise last_error
+        finally:
+            for task in pending:
+                task.cancel()
     
     async def _search_google_api(
         self,
@@ -112,36 +227,41 @@ class GoogleClassicSearchTool(BaseSearchTool):
         region: str
     ) -> List[SearchResult]:
         """Search using Google Custom Search API."""
+        self._check_api_available("google", "Google API")
         session = await self._get_session()
         
-        # Google Custom Search API parameters
-        params = {
-            "key": self.google_api_key,
-            "cx": self.google_cse_id,
-            "q": query,
-            "num": min(max_results, 10),  # Google API max is 10 per request
-            "hl": language,
-            "gl": region.lower(),
-            "safe": "off",
-            "searchType": "text"
-        }
-        
-        url = "https://www.googleapis.com/customsearch/v1"
+        url = self._google_api_base.update_query(
+            q=query,
+            num=min(max_results, 10),  # Google API max is 10 per request
+            hl=language,
+            gl=region.lower()
+        )
         
         try:
-            async with session.get(url, params=params) as response:
+            async with self._get_api_semaphore(), session.get(
+                url, headers=self.default_headers, timeout=_GOOGLE_TIMEOUT
+            ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = json_loads(await self._read_response_body(response))
                     return self._parse_google_api_results(data, max_results)
                 elif response.status == 429:
-                    raise Exception("Google API rate limit exceeded (429) - daily quota may be exhausted")
+                    retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
+                    self._block_api("google", retry_after)
+                    raise RateLimitError(
+                        "Google API rate limit exceeded (429) - daily quota may be exhausted",
+                        retry_after=retry_after,
+                        status=429
+                    )
                 elif response.status == 403:
-                    raise Exception("Google API access forbidden (403) - check API key and billing")
+                    self._block_api("google")
+                    raise HardFailError("Google API access forbidden (403) - check API key and billing", status=403)
                 elif response.status == 400:
-                    error_data = await response.json()
+                    error_data = json_loads(await self._read_response_body(response))
                     error_msg = error_data.get("error", {}).get("message", "Bad request")
                     raise Exception(f"Google API bad request (400): {error_msg}")
                 else:
+                    # Remaining 5xx responses are transient and worth retrying
+                    self._raise_for_transient_status(response.status, response.headers, "Google API")
                     raise Exception(f"Google API failed with status {response.status}")
                     
         except aiohttp.ClientError as e:
@@ -155,96 +275,152 @@ class GoogleClassicSearchTool(BaseSearchTool):
         region: str
     ) -> List[SearchResult]:
         """Search using SerpAPI."""
-        session = await self._get_session()
+        self._check_api_available("serpapi", "SerpAPI")
+        url = self._serpapi_base.update_query(
+            q=query,
+            num=min(max_results, 20),  # SerpAPI allows more results
+            hl=language,
+            gl=region.lower()
+        )
         
-        # SerpAPI parameters
-        params = {
-            "q": query,
-            "api_key": self.serpapi_key,
-            "engine": "google",
-            "num": min(max_results, 20),  # SerpAPI allows more results
-            "hl": language,
-            "gl": region.lower(),
-            "safe": "off",
-            "format": "json"
-        }
+        if self.use_http2:
+            return await self._search_serpapi_http2(url, max_results)
         
-        url = "https://serpapi.com/search"
+        session = await self._get_session()
         
         try:
-            async with session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return self._parse_serpapi_results(data, max_results)
-                elif response.status == 429:
-                    raise Exception("SerpAPI rate limit exceeded (429)")
-                elif response.status == 402:
-                    raise Exception("SerpAPI quota exceeded (402) - check your plan limits")
-                elif response.status == 401:
-                    raise Exception("SerpAPI unauthorized (401) - check your API key")
-                else:
-                    raise Exception(f"SerpAPI failed with status {response.status}")
+            async with self._get_api_semaphore(), session.get(
+                url, headers=self.default_headers, timeout=_SERP_TIMEOUT
+            ) as response:
+                body = await self._read_response_body(response) if response.status == 200 else b""
+                return self._handle_serpapi_response(response.status, response.headers, body, max_results)
                     
         except aiohttp.ClientError as e:
             raise Exception(f"SerpAPI connection error: {str(e)}")
     
+    async def _search_serpapi_http2(self, url: URL, max_results: int) -> List[SearchResult]:
+        """Search using SerpAPI over a multiplexed HTTP/2 connection."""
+        if self._http2_client is None:
+            self._http2_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                timeout=httpx.Timeout(_SERP_TIMEOUT.total, connect=_SERP_TIMEOUT.connect, read=_SERP_TIMEOUT.sock_read),
+                headers=self.default_headers
+            )
+        
+        try:
+            async with self._get_api_semaphore(), self._http2_client.stream("GET", str(url)) as response:
+                body = b""
+                if response.status_code == 200:
+                    content_length = response.headers.get("Content-Length")
+                    body = await self._read_limited(
+                        response.aiter_bytes(),
+                        int(content_length) if content_length else None
+                    )
+                return self._handle_serpapi_response(response.status_code, response.headers, body, max_results)
+                
+        except httpx.HTTPError as e:
+            raise Exception(f"SerpAPI connection error: {str(e)}")
+    
+    def _handle_serpapi_response(self, status: int, headers, body: bytes, max_results: int) -> List[SearchResult]:
+        """Turn a SerpAPI status/body into results, or raise the matching error."""
+        if status == 200:
+            data = json_loads(body)
+            return self._parse_serpapi_results(data, max_results)
+        elif status in (429, 503):
+            retry_after = self._parse_retry_after(headers.get("Retry-After"))
+            if status == 429:
+                self._block_api("serpapi", retry_after)
+            raise RateLimitError(
+                f"SerpAPI rate limit exceeded ({status})",
+                retry_after=retry_after,
+                status=status
+            )
+        elif status == 402:
+            self._block_api("serpapi")
+            raise Exception("SerpAPI quota exceeded (402) - check your plan limits")
+        elif status == 401:
+            raise Exception("SerpAPI unauthorized (401) - check your API key")
+        else:
+            # Remaining 5xx responses are transient and worth retrying
+            self._raise_for_transient_status(status, headers, "SerpAPI")
+            raise Exception(f"SerpAPI failed with status {status}")
+    
+    @staticmethod
+    def _google_api_snippet(item: dict) -> str:
+        """Pick the longer of the result snippet and its pagemap description."""
+        snippet = item.get("snippet", "")
+        
+        # Try to get better snippet from pagemap
+        metatags = (item.get("pagemap") or {}).get("metatags")
+        if metatags:
+            meta = metatags[0]
+            meta_description = meta.get("og:description") or meta.get("description")
+            if meta_description and len(meta_description) > len(snippet):
+                snippet = meta_description
+        
+        return snippet
+    
+    @staticmethod
+    def _serpapi_snippet(result: dict) -> str:
+        """Build a SerpAPI snippet, appending rich snippet extensions if present."""
+        snippet = result.get("snippet", "")
+        extensions = result.get("rich_snippet", {}).get("top", {}).get("extensions")
+        
+        if extensions:
+            extensions = " | ".join(extensions)
+            snippet = f"{snippet}\n{extensions}" if snippet else extensions
+        
+        return snippet
+    
     def _parse_google_api_results(self, data: dict, max_results: int) -> List[SearchResult]:
         """Parse Google Custom Search API results."""
-        results = []
+        items = data.get("items") or ()
+        search_info = data.get("searchInformation") or {}
+        search_time = search_info.get("searchTime")
+        total_results = search_info.get("totalResults")
         
-        items = data.get("items", [])
-        search_info = data.get("searchInformation", {})
+        result_cls = SearchResult
+        pick_snippet = self._google_api_snippet
+        relevances = _RELEVANCES
+        num_relevances = len(relevances)
         
-        for i, item in enumerate(items[:max_results]):
-            # Extract snippet, handling pagemap data
-            snippet = item.get("snippet", "")
-            
-            # Try to get better snippet from pagemap
-            pagemap = item.get("pagemap", {})
-            if pagemap.get("metatags"):
-                meta_description = pagemap["metatags"][0].get("og:description") or \
-                                pagemap["metatags"][0].get("description")
-                if meta_description and len(meta_description) > len(snippet):
-                    snippet = meta_description
-            
-            results.append(SearchResult(
+        return [
+            result_cls(
                 title=item.get("title", f"Result {i+1}")[:150],
                 url=item.get("link", ""),
-                snippet=snippet[:400],
-                relevance=0.95 - (i * 0.05),
+                snippet=pick_snippet(item)[:400],
+                relevance=relevances[i] if i < num_relevances else 0.0,
                 metadata={
                     "source": "google_api",
                     "position": i + 1,
                     "display_link": item.get("displayLink", ""),
                     "formatted_url": item.get("formattedUrl", ""),
-                    "search_time": search_info.get("searchTime"),
-                    "total_results": search_info.get("totalResults")
+                    "search_time": search_time,
+                    "total_results": total_results
                 }
-            ))
-        
-        return results
+            )
+            for i, item in enumerate(items[:max_results])
+        ]
     
     def _parse_serpapi_results(self, data: dict, max_results: int) -> List[SearchResult]:
         """Parse SerpAPI results."""
-        results = []
+        organic_results = data.get("organic_results") or ()
+        search_metadata = data.get("search_metadata") or {}
+        search_id = search_metadata.get("id")
+        engine = search_metadata.get("engine")
         
-        organic_results = data.get("organic_results", [])
-        search_metadata = data.get("search_metadata", {})
+        result_cls = SearchResult
+        pick_snippet = self._serpapi_snippet
+        relevances = _RELEVANCES
+        num_relevances = len(relevances)
         
-        for i, result in enumerate(organic_results[:max_results]):
-            # Extract rich snippet if available
-            snippet = result.get("snippet", "")
-            rich_snippet = result.get("rich_snippet", {})
-            
-            if rich_snippet.get("top", {}).get("extensions"):
-                extensions = " | ".join(rich_snippet["top"]["extensions"])
-                snippet = f"{snippet}\n{extensions}" if snippet else extensions
-            
-            results.append(SearchResult(
+        return [
+            result_cls(
                 title=result.get("title", f"Result {i+1}")[:150],
                 url=result.get("link", ""),
-                snippet=snippet[:400],
-                relevance=0.95 - (i * 0.05),
+                snippet=pick_snippet(result)[:400],
+                relevance=relevances[i] if i < num_relevances else 0.0,
                 metadata={
                     "source": "serpapi",
                     "position": result.get("position", i + 1),
@@ -253,12 +429,12 @@ class GoogleClassicSearchTool(BaseSearchTool):
                     "date": result.get("date"),
                     "cached_page_link": result.get("cached_page_link"),
                     "related_pages_link": result.get("related_pages_link"),
-                    "search_id": search_metadata.get("id"),
-                    "engine": search_metadata.get("engine")
+                    "search_id": search_id,
+                    "engine": engine
                 }
-            ))
-        
-        return results
+            )
+            for i, result in enumerate(organic_results[:max_results])
+        ]
     
     def get_api_status(self) -> dict:
         """Get status of available APIs."""
@@ -266,6 +442,10 @@ class GoogleClassicSearchTool(BaseSearchTool):
             "google_api_available": self.use_google_api,
             "serpapi_available": self.use_serpapi,
             "preferred_api": self.preferred_api,
+            "max_concurrency": self.max_concurrency,
+            "blocked_apis": sorted(
+                api for api, until in self._api_blocked_until.items() if until > time.monotonic()
+            ),
             "google_api_key_configured": bool(self.google_api_key),
             "google_cse_id_configured": bool(self.google_cse_id),
             "serpapi_key_configured": bool(self.serpapi_key)
@@ -273,5 +453,9 @@ class GoogleClassicSearchTool(BaseSearchTool):
     
     async def cleanup(self):
         """Clean up resources."""
-        if self.session and not self.session.closed:
-            await self.session.close()
\ No newline at end of file
+        if self._http2_client is not None:
+            await self._http2_client.aclose()
+            self._http2_client = None
+        if self.session is not None:
+            session, self.session = self.session, None
+            await release_shared_session(session)
\ No newline at end of file
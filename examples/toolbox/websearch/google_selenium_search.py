@@ -7,8 +7,10 @@ Uses headless Chrome/Firefox to bypass API rate limits and access real Google se
 
 import asyncio
 import re
-from typing import List, Optional
-from urllib.parse import quote_plus
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from urllib.parse import quote_plus, urlencode
 
 try:
     from selenium import webdriver
@@ -25,6 +27,111 @@ except ImportError:
 from .base_search import BaseSearchTool, SearchResult
 
 
+_GOOGLE_SEARCH_URL = "https://www.google.com/search"
+_GOOGLE_FIXED_PARAMS = urlencode({
+    'num': 20,       # Number of results per page
+    'safe': 'off',   # Safe search off
+    'filter': '0'    # Don't filter similar results
+})
+
+# Pulls title/url/snippet for every result in one WebDriver round trip.
+# Container selectors are tried in order and the first that matches wins; a
+# union would also match outer containers holding several results
+_EXTRACT_RESULTS_JS = """
+const maxResults = arguments[0];
+const snippetSelector = arguments[1];
+const resultSelectors = arguments[2];
+let nodes = [];
+for (const selector of resultSelectors) {
+    try {
+        nodes = document.querySelectorAll(selector);
+    } catch (e) {
+        continue;  // browsers without :has()
+    }
+    if (nodes.length) break;
+}
+const seen = new Set();
+const out = [];
+for (const node of nodes) {
+    if (out.length >= maxResults) break;
+    const h3 = node.querySelector('h3');
+    if (!h3) continue;
+    const link = h3.closest('a[href]') || node.querySelector('a[href]');
+    if (!link) continue;
+    const url = link.href;
+    if (!/^https?:\\/\\//.test(url) || seen.has(url)) continue;
+    const title = (h3.innerText || h3.textContent || '').trim();
+    if (!title) continue;
+    seen.add(url);
+    let snippet = '';
+    for (const el of node.querySelectorAll(snippetSelector)) {
+        const text = (el.innerText || '').trim();
+        if (text.length > snippet.length) snippet = text;
+    }
+    if (!snippet) {
+        snippet = (node.innerText || '').trim();
+        if (snippet.startsWith(title)) snippet = snippet.slice(title.length).trim();
+        snippet = snippet.slice(0, 300);
+    }
+    out.push({title: title, url: url, snippet: snippet});
+}
+return out;
+"""
+
+# Reads title/url/snippet of a single result element in one round trip
+_EXTRACT_ONE_JS = """
+const node = arguments[0];
+const h3 = node.querySelector('h3');
+if (!h3) return null;
+const link = h3.closest('a[href]') || node.querySelector('a[href]');
+if (!link) return null;
+let snippet = '';
+for (const el of node.querySelectorAll(arguments[1])) {
+    const text = (el.innerText || '').trim();
+    if (text.length > snippet.length) snippet = text;
+}
+return [(h3.innerText || h3.textContent || '').trim(), link.href || '', snippet, node.innerText || ''];
+"""
+
+_HTTP_RE = re.compile(r"^https?://")
+
+# Result containers for both extractors, tried in order
+_RESULT_SELECTORS = (
+    ".g:has([data-ved])",  # Standard organic results
+    ".g",                  # Fallback for organic results
+    "[data-ved]:has(h3)",  # Results with h3 titles
+)
+
+# Title candidates, tried in order
+_TITLE_SELECTORS = ("h3 a", "a h3", "[data-ved] h3", "h3")
+
+# Snippet candidates as one union so the longest is found in a single lookup:
+# standard snippet, alternative class, multi-line snippets, legacy class
+_SNIPPET_SELECTOR = "[data-sncf], .VwiC3b, [style*='-webkit-line-clamp'], .s"
+
+# Consent/cookie buttons, most specific first
+_CONSENT_SELECTORS = (
+    "#L2AGLb",  # Common Google consent button ID
+    ".QS5gu",   # Another consent button class
+    "button[aria-label*='Accept']",
+    "button[aria-label*='I agree']",
+    "[id*='accept']",
+    "[id*='consent']"
+)
+
+# Clicks the first visible consent button, testing every selector in one call
+_CLICK_CONSENT_JS = """
+for (const selector of arguments[0]) {
+    const el = document.querySelector(selector);
+    if (el && el.offsetParent !== null && !el.disabled) {
+        el.click();
+        return true;
+    }
+}
+return false;
+"""
+
+
 class GoogleSeleniumSearchTool(BaseSearchTool):
     """
     Google search implementation using Selenium WebDriver.
@@ -38,8 +145,14 @@ class GoogleSeleniumSearchTool(BaseSearchTool):
     - page_load_timeout: Maximum time to wait for page load (default: 30)
     - element_timeout: Maximum time to wait for elements (default: 10)
     - window_size: Browser window size (default: "1920,1080")
+    - selenium_workers: Threads used for blocking WebDriver calls (default: 2)
+    - block_images: Don't download images on result pages (default: True)
+    - driver_pool_size: Warm WebDriver instances kept for concurrent searches (default: 2)
+    - driver_max_uses: Searches before a driver is recycled (default: 50)
     """
     
+    rate_limit_host = "www.google.com"
+    
     def __init__(self, tool_id: str = None, config: dict = None):
         if not SELENIUM_AVAILABLE:
             raise ImportError(
@@ -60,9 +173,53 @@ class GoogleSeleniumSearchTool(BaseSearchTool):
         self.page_load_timeout = self.config.get("page_load_timeout", 30)
         self.element_timeout = self.config.get("element_timeout", 10)
         self.window_size = self.config.get("window_size", "1920,1080")
+        self.selenium_workers = self.config.get("selenium_workers", 2)
+        self.block_images = self.config.get("block_images", True)
+        self.driver_pool_size = self.config.get("driver_pool_size", 2)
+        self.driver_max_uses = self.config.get("driver_max_uses", 50)
+        
+        # Warm drivers are created lazily, handed out one search at a time and
+        # recycled after driver_max_uses searches or a WebDriver error
+        self._idle_drivers: List = []
+        self._driver_uses: Dict[int, int] = {}
+        self._drivers = set()
+        self._consent_checked = set()
+        self._driver_slots: Optional[asyncio.Semaphore] = None
         
-        # Driver will be created per search to avoid stale sessions
-        self.driver = None
+        # Browser switches and preferences are fixed per tool; only the user
+        # agent varies between drivers
+        common_args = ["--headless"] if self.headless else []
+        common_args += ["--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu"]
+        self._base_firefox_args = common_args + [f"--window-size={self.window_size}"]
+        self._base_firefox_prefs = [
+            # Privacy settings
+            ("privacy.trackingprotection.enabled", False),
+            ("dom.webnotifications.enabled", False)
+        ]
+        self._base_chrome_args = common_args + [
+            "--disable-web-security",
+            "--disable-features=VizDisplayCompositor",
+            f"--window-size={self.window_size}",
+            # Additional privacy/stealth options
+            "--disable-blink-features=AutomationControlled"
+        ]
+        self._base_chrome_experimental = [
+            ("excludeSwitches", ["enable-automation"]),
+            ("useAutomationExtension", False)
+        ]
+        
+        # Results are read from the DOM only; skip images and notification prompts
+        if self.block_images:
+            self._base_firefox_prefs.append(("permissions.default.image", 2))
+            self._base_chrome_args.append("--blink-settings=imagesEnabled=false")
+            self._base_chrome_experimental.append(("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2
+            }))
+        
+        # Blocking WebDriver calls run off the event loop; the pool is created
+        # on first use so the tool still works after cleanup()
+        self._selenium_pool: Optional[ThreadPoolExecutor] = None
     
     def _initialize(self):
         """Initialize WebDriver settings."""
@@ -70,44 +227,27 @@ class GoogleSeleniumSearchTool(BaseSearchTool):
     
     def _create_driver(self):
         """Create a new WebDriver instance."""
+        # Options objects are mutable, so each driver gets its own built from
+        # the precomputed settings
+        user_agent = self.get_random_user_agent()
+        
         if self.browser_type == "firefox":
             options = FirefoxOptions()
-            if self.headless:
-                options.add_argument("--headless")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
-            options.add_argument(f"--window-size={self.window_size}")
-            
-            # Set user agent
-            user_agent = self.get_random_user_agent()
+            for arg in self._base_firefox_args:
+                options.add_argument(arg)
+            for name, value in self._base_firefox_prefs:
+                options.set_preference(name, value)
             options.set_preference("general.useragent.override", user_agent)
             
-            # Privacy settings
-            options.set_preference("privacy.trackingprotection.enabled", False)
-            options.set_preference("dom.webnotifications.enabled", False)
-            
             driver = webdriver.Firefox(options=options)
         else:
             # Default to Chrome
             options = ChromeOptions()
-            if self.headless:
-                options.add_argument("--headless")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--disable-web-security")
-            options.add_argument("--disable-features=VizDisplayCompositor")
-            options.add_argument(f"--window-size={self.window_size}")
-            
-            # Set user agent
-            user_agent = self.get_random_user_agent()
+            for arg in self._base_chrome_args:
+                options.add_argument(arg)
             options.add_argument(f"--user-agent={user_agent}")
-            
-            # Additional privacy/stealth options
-            options.add_argument("--disable-blink-features=AutomationControlled")
-            options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            options.add_experimental_option('useAutomationExtension', False)
+            for name, value in self._base_chrome_experimental:
+                options.add_experimental_option(name, value)
             
             driver = webdriver.Chrome(options=options)
             
@@ -120,6 +260,63 @@ class GoogleSeleniumSearchTool(BaseSearchTool):
         
         return driver
     
+    async def _acquire_driver(self):
+        """Take a warm driver from the pool, creating one if none is idle."""
+        if self._driver_slots is None:
+            self._driver_slots = asyncio.Semaphore(self.driver_pool_size)
+        await self._driver_slots.acquire()
+        
+        try:
+            if self._idle_drivers:
+                return self._idle_drivers.pop()
+            
+            await self._log_info(f"Creating WebDriver for Google search")
+            driver = await self._run_blocking(self._create_driver)
+            self._drivers.add(driver)
+            return driver
+        except BaseException:
+            self._driver_slots.release()
+            raise
+    
+    async def _release_driver(self, driver, discard: bool = False):
+        """Return a driver to the pool, or quit it if it is worn out or broken."""
+        try:
+            uses = self._driver_uses.get(id(driver), 0) + 1
+            self._driver_uses[id(driver)] = uses
+            
+            if not discard and uses < self.driver_max_uses:
+                try:
+                    # Clear page state before the next query; cookies (and with
+                    # them any accepted consent) are kept
+                    await self._run_blocking(driver.get, "about:blank")
+                    self._idle_drivers.append(driver)
+                    return
+                except Exception:
+                    pass
+            
+            await self._run_blocking(self._quit_driver, driver)
+        finally:
+            self._driver_slots.release()
+    
+    def _quit_driver(self, driver):
+        """Quit a WebDriver and forget its bookkeeping."""
+        self._drivers.discard(driver)
+        self._consent_checked.discard(driver)
+        self._driver_uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except:
+            pass
+    
+    async def _run_blocking(self, func, *args):
+        """Run a blocking WebDriver call in the Selenium thread pool."""
+        if self._selenium_pool is None:
+            self._selenium_pool = ThreadPoolExecutor(
+                max_workers=max(self.selenium_workers, self.driver_pool_size)
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._selenium_pool, func, *args)
+    
     async def _perform_search(
         self,
         query: str,
@@ -130,35 +327,28 @@ class GoogleSeleniumSearchTool(BaseSearchTool):
         """
         Perform Google search using Selenium WebDriver.
         
-        Creates a new driver instance for each search to avoid stale sessions.
+        Takes a pooled driver per search; a driver is only re-created after
+        driver_max_uses searches or a WebDriver error.
         """
         driver = None
+        discard = False
         try:
-            # Create driver for this search
-            await self._log_info(f"Creating WebDriver for Google search")
-            driver = self._create_driver()
+            # Inside the try so driver creation errors are translated below
+            driver = await self._acquire_driver()
             
             # Build Google search URL
             search_url = self._build_search_url(query, language, region)
             
             await self._log_info(f"Navigating to Google search", url=search_url)
-            driver.get(search_url)
-            
-            # Wait for search results to load
-            wait = WebDriverWait(driver, self.element_timeout)
+            await self._run_blocking(driver.get, search_url)
             
             # Handle potential consent/cookie dialogs
-            await self._handle_consent_dialogs(driver)
+            if await self._run_blocking(self._handle_consent_dialogs, driver):
+                await self._log_info(f"Accepted consent dialog")
             
             # Wait for search results
-            try:
-                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "[data-ved]")))
-            except TimeoutException:
-                # Try alternative selector
-                try:
-                    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".g")))
-                except TimeoutException:
-                    raise Exception("Google search results did not load - possible blocking or CAPTCHA")
+            if not await self._run_blocking(self._wait_for_results, driver):
+                raise Exception("Google search results did not load - possible blocking or CAPTCHA")
             
             # Extract search results
             results = await self._extract_search_results(driver, max_results)
@@ -172,6 +362,8 @@ class GoogleSeleniumSearchTool(BaseSearchTool):
             return results
             
         except WebDriverException as e:
+            # Driver may be poisoned; replace it rather than returning it to the pool
+            discard = True
             if "chrome not reachable" in str(e).lower():
                 raise Exception("Chrome browser not accessible - may be blocked or crashed")
             elif "session not created" in str(e).lower():
@@ -184,78 +376,91 @@ class GoogleSeleniumSearchTool(BaseSearchTool):
             raise
         
         finally:
-            # Always clean up driver
-            if driver:
-                try:
-                    driver.quit()
-                except:
-                    pass
-            self.driver = None
+            if driver is not None:
+                await self._release_driver(driver, discard)
     
     def _build_search_url(self, query: str, language: str, region: str) -> str:
         """Build Google search URL with proper parameters."""
-        # Base Google search URL
-        base_url = "https://www.google.com/search"
-        
-        # URL parameters
-        params = {
+        # Only the per-query parameters are encoded here; the rest is constant
+        params = urlencode({
             'q': query,
-            'hl': language,           # Interface language
-            'gl': region.lower(),     # Geographic location
-            'num': 20,               # Number of results per page
-            'safe': 'off',           # Safe search off
-            'filter': '0'            # Don't filter similar results
-        }
-        
-        # Build URL manually to ensure proper encoding
-        param_string = "&".join([f"{k}={quote_plus(str(v))}" for k, v in params.items()])
-        return f"{base_url}?{param_string}"
+            'hl': language,        # Interface language
+            'gl': region.lower()   # Geographic location
+        }, quote_via=quote_plus)
+        return f"{_GOOGLE_SEARCH_URL}?{params}&{_GOOGLE_FIXED_PARAMS}"
     
-    async def _handle_consent_dialogs(self, driver):
-        """Handle Google consent/cookie dialogs."""
+    def _handle_consent_dialogs(self, driver) -> bool:
+        """Handle Google consent/cookie dialogs. Returns True if one was accepted."""
+        # The consent cookie persists on a pooled driver, so only its first page needs checking
+        if driver in self._consent_checked:
+            return False
+        
         try:
-            # Wait briefly for consent dialog
-            wait = WebDriverWait(driver, 3)
-            
-            # Try to accept cookies/consent
-            consent_selectors = [
-                "[id*='accept']",
-                "[id*='consent']", 
-                "button[aria-label*='Accept']",
-                "button[aria-label*='I agree']",
-                "#L2AGLb",  # Common Google consent button ID
-                ".QS5gu"   # Another consent button class
-            ]
-            
-            for selector in consent_selectors:
-                try:
-                    button = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selector)))
-                    button.click()
-                    await self._log_info(f"Accepted consent dialog")
-                    asyncio.sleep(1)  # Wait for dialog to close
-                    break
-                except (TimeoutException, NoSuchElementException):
-                    continue
-                    
+            # Poll briefly for any consent button, trying all selectors per poll
+            WebDriverWait(driver, 1).until(
+                lambda d: d.execute_script(_CLICK_CONSENT_JS, list(_CONSENT_SELECTORS))
+            )
+            time.sleep(0.3)  # Let the dialog close; the click itself is synchronous
+            return True
+        except TimeoutException:
+            return False
         except Exception:
             # Consent handling is optional - continue if it fails
-            pass
+            return False
+        finally:
+            self._consent_checked.add(driver)
+    
+    def _wait_for_results(self, driver) -> bool:
+        """Block until search results are present. Returns False on timeout."""
+        wait = WebDriverWait(driver, self.element_timeout)
+        try:
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "[data-ved]")))
+            return True
+        except TimeoutException:
+            # Try alternative selector
+            try:
+                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".g")))
+                return True
+            except TimeoutException:
+                return False
     
     async def _extract_search_results(self, driver, max_results: int) -> List[SearchResult]:
         """Extract search results from the page."""
+        # Fast path: one script call instead of several WebDriver calls per result
+        try:
+            raw_results = await self._run_blocking(
+                driver.execute_script, _EXTRACT_RESULTS_JS, max_results, _SNIPPET_SELECTOR,
+                list(_RESULT_SELECTORS)
+            )
+        except WebDriverException as e:
+            await self._log_warning(f"Script-based extraction failed, using element extraction", error=str(e))
+            raw_results = None
+        
+        if raw_results:
+            return [
+                SearchResult(
+                    title=item.get("title", "")[:150],
+                    url=item.get("url", ""),
+                    snippet=(item.get("snippet") or "No description available")[:400],
+                    relevance=max(0.0, 0.9 - (i * 0.05)),
+                    metadata={
+                        "source": "google_selenium",
+                        "position": i + 1,
+                        "extraction_method": "selenium_script"
+                    }
+                )
+                for i, item in enumerate(raw_results)
+            ]
+        
         results = []
         
         # Try multiple selectors for different Google layouts
-        result_selectors = [
-            ".g:has([data-ved])",  # Standard organic results
-            ".g",                  # Fallback for organic results
-            "[data-ved]:has(h3)",  # Results with h3 titles
-        ]
-        
         result_elements = []
-        for selector in result_selectors:
+        for selector in _RESULT_SELECTORS:
             try:
-                result_elements = driver.find_elements(By.CSS_SELECTOR, selector)
+                result_elements = await self._run_blocking(
+                    driver.find_elements, By.CSS_SELECTOR, selector
+                )
                 if result_elements:
                     await self._log_info(f"Found {len(result_elements)} results with selector: {selector}")
                     break
@@ -265,92 +470,43 @@ class GoogleSeleniumSearchTool(BaseSearchTool):
         if not result_elements:
             raise Exception("No search results found - Google may have blocked the request")
         
-        # Process each result element
-        for i, element in enumerate(result_elements[:max_results]):
-            try:
-                result = await self._extract_single_result(element, i)
-                if result:
-                    results.append(result)
-            except Exception as e:
-                await self._log_warning(f"Failed to extract result {i+1}", error=str(e))
-                continue
+        # A WebDriver session is not thread-safe, so all elements are read
+        # sequentially in a single pool call
+        extracted = await self._run_blocking(
+            self._extract_result_elements, result_elements[:max_results]
+        )
+        
+        for i, result in enumerate(extracted):
+            if isinstance(result, Exception):
+                await self._log_warning(f"Failed to extract result {i+1}", error=str(result))
+            elif result:
+                results.append(result)
         
         return results
     
-    async def _extract_single_result(self, element, position: int) -> Optional[SearchResult]:
+    def _extract_result_elements(self, elements) -> List:
+        """Extract each element in turn; failures are returned in place of results."""
+        extracted = []
+        for i, element in enumerate(elements):
+            try:
+                extracted.append(self._extract_single_result(element, i))
+            except Exception as e:
+                extracted.append(e)
+        return extracted
+    
+    def _extract_single_result(self, element, position: int) -> Optional[SearchResult]:
         """Extract data from a single search result element."""
         try:
-            # Extract title and URL
-            title_link = None
-            title_selectors = ["h3 a", "a h3", "[data-ved] h3", "h3"]
-            
-            for selector in title_selectors:
-                try:
-                    title_elements = element.find_elements(By.CSS_SELECTOR, selector)
-                    if title_elements:
-                        # Find the link element
-                        if selector.endswith(" a"):
-                            title_link = title_elements[0]
-                        else:
-                            # Look for parent link
-                            for te in title_elements:
-                                parent_link = te.find_element(By.XPATH, "./ancestor-or-self::a")
-                                if parent_link:
-                                    title_link = parent_link
-                                    break
-                        
-                        if title_link:
-                            break
-                except (NoSuchElementException, Exception):
-                    continue
-            
-            if not title_link:
+            fields = self._read_result_fields_js(element) or self._read_result_fields(element)
+            if not fields:
                 return None
-            
-            # Get title and URL
-            title = title_link.text.strip()
-            url = title_link.get_attribute("href")
-            
-            if not title or not url or not url.startswith("http"):
-                return None
-            
-            # Extract snippet
-            snippet = ""
-            snippet_selectors = [
-                "[data-sncf]",           # Standard snippet
-                ".VwiC3b",               # Alternative snippet class
-                "[style*='-webkit-line-clamp']",  # Multi-line snippets
-                ".s",                    # Legacy snippet class
-                "span:contains('...'),div:contains('...')"  # Any text with ellipsis
-            ]
-            
-            for selector in snippet_selectors:
-                try:
-                    snippet_elements = element.find_elements(By.CSS_SELECTOR, selector)
-                    for se in snippet_elements:
-                        text = se.text.strip()
-                        if text and len(text) > len(snippet):
-                            snippet = text
-                except Exception:
-                    continue
-            
-            # Fallback: get any text content from the result
-            if not snippet:
-                try:
-                    snippet = element.text.strip()
-                    # Clean up the snippet (remove title from beginning)
-                    if snippet.startswith(title):
-                        snippet = snippet[len(title):].strip()
-                    # Limit length
-                    snippet = snippet[:300]
-                except Exception:
-                    snippet = "No description available"
-            
+            title, url, snippet = fields
+
             return SearchResult(
                 title=title[:150],
                 url=url,
                 snippet=snippet[:400],
-                relevance=0.9 - (position * 0.05),
+                relevance=max(0.0, 0.9 - (position * 0.05)),
                 metadata={
                     "source": "google_selenium",
                     "position": position + 1,
@@ -362,12 +518,95 @@ class GoogleSeleniumSearchTool(BaseSearchTool):
             # Use print instead of async logging in sync method
             print(f"Warning: Failed to extract single result {position+1}: {str(e)}")
             return None
+
+    def _read_result_fields_js(self, element) -> Optional[tuple]:
+        """Read title/url/snippet with one script call; None if the script fails."""
+        try:
+            # WebElement.parent is the owning driver
+            fields = element.parent.execute_script(_EXTRACT_ONE_JS, element, _SNIPPET_SELECTOR)
+        except Exception:
+            return None
+        if not fields:
+            return None
+
+        title, url, snippet, text = fields
+        title = title.strip()
+        if not title or not _HTTP_RE.match(url):
+            return None
+        if not snippet:
+            snippet = text.strip()
+            if snippet.startswith(title):
+                snippet = snippet[len(title):].strip()
+            snippet = snippet[:300]
+        return title, url, snippet
+
+    def _read_result_fields(self, element) -> Optional[tuple]:
+        """Read title/url/snippet through individual element lookups."""
+        # Extract title and URL
+        title_link = None
+        
+        for selector in _TITLE_SELECTORS:
+            try:
+                title_elements = element.find_elements(By.CSS_SELECTOR, selector)
+                if title_elements:
+                    # Find the link element
+                    if selector.endswith(" a"):
+                        title_link = title_elements[0]
+                    else:
+                        # Look for parent link
+                        for te in title_elements:
+                            parent_link = te.find_element(By.XPATH, "./ancestor-or-self::a")
+                            if parent_link:
+                                title_link = parent_link
+                                break
+                    
+                    if title_link:
+                        break
+            except (NoSuchElementException, Exception):
+                continue
+        
+        if not title_link:
+            return None
+        
+        # Get title and URL
+        title = title_link.text.strip()
+        url = title_link.get_attribute("href")
+        
+        if not title or not url or not _HTTP_RE.match(url):
+            return None
+        
+        # Extract snippet
+        snippet = ""
+        try:
+            for se in element.find_elements(By.CSS_SELECTOR, _SNIPPET_SELECTOR):
+                text = se.text.strip()
+                if text and len(text) > len(snippet):
+                    snippet = text
+        except Exception:
+            pass
+        
+        # Fallback: get any text content from the result
+        if not snippet:
+            try:
+                snippet = element.text.strip()
+                # Clean up the snippet (remove title from beginning)
+                if snippet.startswith(title):
+                    snippet = snippet[len(title):].strip()
+                # Limit length
+                snippet = snippet[:300]
+            except Exception:
+                snippet = "No description available"
+        
+        return title, url, snippet
     
     async def cleanup(self):
         """Clean up resources."""
-        if self.driver:
-            try:
-                self.driver.quit()
-            except:
-                pass
-            self.driver = None
\ No newline at end of file
+        # Quitting a browser blocks for a while; do it off the loop, in parallel
+        await asyncio.gather(
+            *(self._run_blocking(self._quit_driver, driver) for driver in list(self._drivers)),
+            return_exceptions=True
+        )
+        self._idle_drivers.clear()
+        if self._selenium_pool is not None:
+            self._selenium_pool.shutdown(wait=False)
+            self._selenium_pool = None
\ No newline at end of file
@@ -15,7 +15,7 @@ try:
 except ImportError:
     GOOGLESEARCH_AVAILABLE = False
 
-from .base_search import BaseSearchTool, SearchResult
+from .base_search import BaseSearchTool, SearchResult, HardFailError
 
 
 class GoogleSearchPythonTool(BaseSearchTool):
@@ -37,6 +37,8 @@ class GoogleSearchPythonTool(BaseSearchTool):
     - country: Country code for search (default: "US")
     """
     
+    rate_limit_host = "www.google.com"
+    
     def __init__(self, tool_id: str = None, config: dict = None):
         if not GOOGLESEARCH_AVAILABLE:
             raise ImportError(
@@ -119,7 +121,7 @@ class GoogleSearchPythonTool(BaseSearchTool):
                         title=title,
                         url=result.url,     
                         snippet=description,
-                        relevance=0.9 - (i * 0.05),
+                        relevance=max(0.0, 0.9 - (i * 0.05)),
                         metadata={
                             "source": "googlesearch_python",
                             "position": i + 1,
@@ -142,7 +144,7 @@ class GoogleSearchPythonTool(BaseSearchTool):
             if "429" in error_msg or "too many requests" in error_msg:
                 raise Exception("Google blocked requests - too many requests (429)")
             elif "403" in error_msg or "forbidden" in error_msg:
-                raise Exception("Google access forbidden - possible IP blocking (403)")
+                raise HardFailError("Google access forbidden - possible IP blocking (403)", status=403)
             elif "captcha" in error_msg:
                 raise Exception("Google CAPTCHA detected - IP may be blocked")
             elif "connection" in error_msg:
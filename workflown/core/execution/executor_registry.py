@@ -6,6 +6,7 @@ Manages registration and discovery of task executors.
 
 from typing import Dict, List, Optional, Set
 from datetime import datetime
+from operator import itemgetter
 import asyncio
 
 from .base_executor import BaseExecutor, ExecutorCapability, ExecutorStatus, ExecutorInfo
@@ -179,7 +180,7 @@ class ExecutorRegistry:
             scored_executors.append((score, executor))
         
         # Sort by score (highest first) and return best executor
-        scored_executors.sort(key=lambda x: x[0], reverse=True)
+        scored_executors.sort(key=itemgetter(0), reverse=True)
         return scored_executors[0][1]
     
     def _calculate_executor_score(self, executor: BaseExecutor, task: Task) -> float:
@@ -8,6 +8,7 @@ import asyncio
 import subprocess
 import importlib
 import sys
+import time
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import json
@@ -109,7 +110,7 @@ class TaskExecutor(BaseExecutor):
                 errors=["Executor at maximum capacity"]
             )
         
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         self.current_tasks[task.task_id] = task
         self.status = ExecutorStatus.BUSY
         
@@ -147,7 +148,7 @@ class TaskExecutor(BaseExecutor):
                     "traceback": traceback_str,
                     "executor_id": self.executor_id
                 },
-                execution_time=(datetime.now() - start_time).total_seconds(),
+                execution_time=time.perf_counter() - start_time,
                 timestamp=datetime.now(),
                 errors=[error_msg]
             )
@@ -188,7 +189,7 @@ class TaskExecutor(BaseExecutor):
     
     async def _execute_python_task(self, task: Task) -> TaskResult:
         """Execute a Python code task."""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
             code = task.parameters.get("code", "")
@@ -213,7 +214,7 @@ class TaskExecutor(BaseExecutor):
             except Exception as e:
                 raise RuntimeError(f"Python execution error: {str(e)}")
             
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
             return TaskResult(
                 task_id=task.task_id,
@@ -229,7 +230,7 @@ class TaskExecutor(BaseExecutor):
             )
         
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             return TaskResult(
                 task_id=task.task_id,
                 success=False,
@@ -257,7 +258,7 @@ class TaskExecutor(BaseExecutor):
                 errors=["Shell execution disabled for security"]
             )
         
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
             command = task.parameters.get("command", "")
@@ -285,7 +286,7 @@ class TaskExecutor(BaseExecutor):
                 process.kill()
                 raise RuntimeError(f"Shell command timed out after {self.shell_timeout}s")
             
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
             return TaskResult(
                 task_id=task.task_id,
@@ -306,7 +307,7 @@ class TaskExecutor(BaseExecutor):
             )
         
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             return TaskResult(
                 task_id=task.task_id,
                 success=False,
@@ -323,7 +324,7 @@ class TaskExecutor(BaseExecutor):
     
     async def _execute_function_task(self, task: Task) -> TaskResult:
         """Execute a function call task."""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
             function_path = task.parameters.get("function", "")
@@ -344,7 +345,7 @@ class TaskExecutor(BaseExecutor):
             else:
                 result = function(*args, **kwargs)
             
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
             return TaskResult(
                 task_id=task.task_id,
@@ -360,7 +361,7 @@ class TaskExecutor(BaseExecutor):
             )
         
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             return TaskResult(
                 task_id=task.task_id,
                 success=False,
@@ -377,7 +378,7 @@ class TaskExecutor(BaseExecutor):
     
     async def _execute_http_task(self, task: Task) -> TaskResult:
         """Execute an HTTP request task."""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
             # This would need an HTTP client library like aiohttp
@@ -391,13 +392,13 @@ class TaskExecutor(BaseExecutor):
                     "executor_id": self.executor_id,
                     "error": "HTTP client not implemented"
                 },
-                execution_time=(datetime.now() - start_time).total_seconds(),
+                execution_time=time.perf_counter() - start_time,
                 timestamp=datetime.now(),
                 errors=["HTTP task execution not yet implemented"]
             )
         
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             return TaskResult(
                 task_id=task.task_id,
                 success=False,
@@ -414,10 +415,10 @@ class TaskExecutor(BaseExecutor):
     
     async def _execute_generic_task(self, task: Task) -> TaskResult:
         """Execute a generic task."""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         # Generic task just returns success with task parameters
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = time.perf_counter() - start_time
         
         return TaskResult(
             task_id=task.task_id,
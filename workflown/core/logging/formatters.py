@@ -8,6 +8,12 @@ import json
 from typing import Dict, Any
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .logger import LogEntry, LogLevel
 
 
@@ -100,7 +106,8 @@ class JSONFormatter(LogFormatter):
         self,
         indent: int = None,
         ensure_ascii: bool = False,
-        include_all_fields: bool = True
+        include_all_fields: bool = True,
+        use_orjson: bool = False
     ):
         """
         Initialize JSON formatter.
@@ -109,10 +116,23 @@ class JSONFormatter(LogFormatter):
             indent: JSON indentation (None for compact)
             ensure_ascii: Whether to escape non-ASCII characters
             include_all_fields: Whether to include all log entry fields
+            use_orjson: Encode with orjson when installed; faster, but
+                datetime, enum and dataclass values use orjson's native
+                encoding and indented output differs in whitespace
         """
         self.indent = indent
         self.ensure_ascii = ensure_ascii
         self.include_all_fields = include_all_fields
+        
+        # Opt-in so the default output never depends on what is installed;
+        # orjson covers compact and 2-space output without ASCII escaping
+        self._use_orjson = (
+            use_orjson and ORJSON_AVAILABLE and not ensure_ascii and indent in (None, 2)
+        )
+        if self._use_orjson:
+            self._orjson_option = orjson.OPT_NON_STR_KEYS
+            if indent == 2:
+                self._orjson_option |= orjson.OPT_INDENT_2
     
     def format(self, entry: LogEntry) -> str:
         """Format log entry as JSON."""
@@ -134,6 +154,12 @@ class JSONFormatter(LogFormatter):
             if entry.exception:
                 data["exception"] = entry.exception
         
+        if self._use_orjson:
+            try:
+                return orjson.dumps(data, default=self._json_serializer, option=self._orjson_option).decode()
+            except TypeError:
+                pass  # e.g. integers beyond 64 bits; fall back to the stdlib encoder
+        
         return json.dumps(
             data,
             indent=self.indent,
@@ -11,9 +11,25 @@ from pathlib import Path
 from datetime import datetime
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .logger import LogHandler, LogEntry, LogLevel
 
 
+def _json_line(data: Dict[str, Any], use_orjson: bool = False) -> str:
+    """Encode a log record as one compact JSON line, optionally with orjson."""
+    if use_orjson and ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; fall back to the stdlib encoder
+    return json.dumps(data, default=str, separators=(',', ':')) + '\n'
+
+
 class ConsoleHandler(LogHandler):
     """Handler that outputs logs to console/terminal."""
     
@@ -165,7 +181,8 @@ class StructuredHandler(LogHandler):
         filename: str = "workflown-structured.log",
         max_size: int = 50 * 1024 * 1024,  # 50MB
         backup_count: int = 10,
-        encoding: str = "utf-8"
+        encoding: str = "utf-8",
+        use_orjson: bool = False
     ):
         """
         Initialize structured handler.
@@ -177,12 +194,16 @@ class StructuredHandler(LogHandler):
             max_size: Maximum file size before rotation
             backup_count: Number of backup files to keep
             encoding: File encoding
+            use_orjson: Encode with orjson when installed; faster, but
+                non-ASCII text is written unescaped and datetime, enum and
+                dataclass values use orjson's native encoding
         """
         super().__init__(name, level)
         self.filename = Path(filename)
         self.max_size = max_size
         self.backup_count = backup_count
         self.encoding = encoding
+        self.use_orjson = use_orjson
         
         # Create directory if needed
         self.filename.parent.mkdir(parents=True, exist_ok=True)
@@ -204,9 +225,7 @@ class StructuredHandler(LogHandler):
                     await self._rotate_file()
                 
                 # Write JSON log entry
-                json_data = entry.to_dict()
-                json_line = json.dumps(json_data, default=str, separators=(',', ':'))
-                self._file.write(json_line + '\n')
+                self._file.write(_json_line(entry.to_dict(), self.use_orjson))
                 self._file.flush()
                 
             except Exception as e:
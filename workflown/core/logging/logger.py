@@ -149,6 +149,10 @@ class WorkflownLogger:
         """Set the minimum log level."""
         self.level = level
     
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """Check if a message at this level would be logged."""
+        return level >= self.level
+    
     def set_correlation_id(self, correlation_id: str) -> None:
         """Set correlation ID for request tracking."""
         self.correlation_id = correlation_id
@@ -170,6 +174,7 @@ class WorkflownLogger:
         self,
         level: LogLevel,
         message: str,
+        *args,
         exception: Exception = None,
         extra_context: Dict[str, Any] = None,
         **kwargs
@@ -179,7 +184,9 @@ class WorkflownLogger:
         
         Args:
             level: Log level
-            message: Log message
+            message: Log message, optionally with %-style placeholders
+            *args: Values for the placeholders; formatting only happens
+                when the level is enabled
             exception: Optional exception to log
             extra_context: Additional context for this log entry
             **kwargs: Additional context as keyword arguments
@@ -187,6 +194,9 @@ class WorkflownLogger:
         if level < self.level:
             return
         
+        if args:
+            message = message % args
+        
         # Get caller information
         frame = sys._getframe(2)
         
@@ -219,33 +229,33 @@ class WorkflownLogger:
         # Send to handlers
         await self._emit_to_handlers(entry)
     
-    async def debug(self, message: str, **kwargs) -> None:
+    async def debug(self, message: str, *args, **kwargs) -> None:
         """Log a debug message."""
-        await self.log(LogLevel.DEBUG, message, **kwargs)
+        await self.log(LogLevel.DEBUG, message, *args, **kwargs)
     
-    async def info(self, message: str, **kwargs) -> None:
+    async def info(self, message: str, *args, **kwargs) -> None:
         """Log an info message."""
-        await self.log(LogLevel.INFO, message, **kwargs)
+        await self.log(LogLevel.INFO, message, *args, **kwargs)
     
-    async def warning(self, message: str, **kwargs) -> None:
+    async def warning(self, message: str, *args, **kwargs) -> None:
         """Log a warning message."""
-        await self.log(LogLevel.WARNING, message, **kwargs)
+        await self.log(LogLevel.WARNING, message, *args, **kwargs)
     
-    async def error(self, message: str, exception: Exception = None, **kwargs) -> None:
+    async def error(self, message: str, *args, exception: Exception = None, **kwargs) -> None:
         """Log an error message."""
-        await self.log(LogLevel.ERROR, message, exception=exception, **kwargs)
+        await self.log(LogLevel.ERROR, message, *args, exception=exception, **kwargs)
     
-    async def critical(self, message: str, exception: Exception = None, **kwargs) -> None:
+    async def critical(self, message: str, *args, exception: Exception = None, **kwargs) -> None:
         """Log a critical message."""
-        await self.log(LogLevel.CRITICAL, message, exception=exception, **kwargs)
+        await self.log(LogLevel.CRITICAL, message, *args, exception=exception, **kwargs)
     
-    async def exception(self, message: str, **kwargs) -> None:
+    async def exception(self, message: str, *args, **kwargs) -> None:
         """Log an exception with stack trace."""
         exc_type, exc_value, exc_traceback = sys.exc_info()
         if exc_value:
-            await self.log(LogLevel.ERROR, message, exception=exc_value, **kwargs)
+            await self.log(LogLevel.ERROR, message, *args, exception=exc_value, **kwargs)
         else:
-            await self.error(message, **kwargs)
+            await self.error(message, *args, **kwargs)
     
     async def task_started(self, task_id: str, task_type: str, **kwargs) -> None:
         """Log task start event."""
@@ -361,14 +371,18 @@ class WorkflownLogger:
             # No running loop
             asyncio.run(coro)
 
-    def info_sync(self, message: str, **kwargs) -> None:
-        self._run_async_safely(self.info(message, **kwargs))
+    # Level is checked first so filtered messages don't schedule a task
+    def info_sync(self, message: str, *args, **kwargs) -> None:
+        if self.is_enabled_for(LogLevel.INFO):
+            self._run_async_safely(self.info(message, *args, **kwargs))
 
-    def warning_sync(self, message: str, **kwargs) -> None:
-        self._run_async_safely(self.warning(message, **kwargs))
+    def warning_sync(self, message: str, *args, **kwargs) -> None:
+        if self.is_enabled_for(LogLevel.WARNING):
+            self._run_async_safely(self.warning(message, *args, **kwargs))
 
-    def error_sync(self, message: str, exception: Exception = None, **kwargs) -> None:
-        self._run_async_safely(self.error(message, exception=exception, **kwargs))
+    def error_sync(self, message: str, *args, exception: Exception = None, **kwargs) -> None:
+        if self.is_enabled_for(LogLevel.ERROR):
+            self._run_async_safely(self.error(message, *args, exception=exception, **kwargs))
 
 
 # Global logger registry
@@ -7,6 +7,7 @@ Defines the interface for all tools in the workflown framework.
 from abc import ABC, abstractmethod
 import os
 import json
+import time
 from pathlib import Path
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -297,7 +298,9 @@ class BaseTool(ABC):
         # Check capacity
         if self.current_operations >= self.max_concurrent_operations:
             await self.logger.warning(
-                f"Tool at capacity: {self.current_operations}/{self.max_concurrent_operations}",
+                "Tool at capacity: %d/%d",
+                self.current_operations,
+                self.max_concurrent_operations,
                 tool_id=self.tool_id
             )
             return False
@@ -309,7 +312,8 @@ class BaseTool(ABC):
         self.last_activity = datetime.now()
         
         await self.logger.info(
-            f"Starting tool execution: {self.name}",
+            "Starting tool execution: %s",
+            self.name,
             tool_id=self.tool_id,
             operation_count=self.current_operations
         )
@@ -337,7 +341,8 @@ class BaseTool(ABC):
         self.last_activity = datetime.now()
         
         await self.logger.info(
-            f"Tool execution completed: {self.name}",
+            "Tool execution completed: %s",
+            self.name,
             tool_id=self.tool_id,
             success=result.success,
             execution_time=result.execution_time
@@ -354,7 +359,8 @@ class BaseTool(ABC):
         Returns:
             ToolResult with execution results
         """
-        start_time = datetime.now()
+        # Monotonic clock for durations; wall-clock time only for the timestamp
+        start_time = time.perf_counter()
         context = context or {}
         # Capture context for nested/tool-internal calls
         self._current_execution_context = dict(context)
@@ -383,7 +389,7 @@ class BaseTool(ABC):
             result = await self.execute(parameters)
             
             # Update execution time
-            result.execution_time = (datetime.now() - start_time).total_seconds()
+            result.execution_time = time.perf_counter() - start_time
             result.timestamp = datetime.now()
             
             # Persist outputs if enabled
@@ -400,7 +406,7 @@ class BaseTool(ABC):
             return result
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
             error_result = ToolResult(
                 tool_id=self.tool_id,
@@ -421,7 +427,8 @@ class BaseTool(ABC):
                 self.status = "idle"
             
             await self.logger.error(
-                f"Tool execution failed: {self.name}",
+                "Tool execution failed: %s",
+                self.name,
                 tool_id=self.tool_id,
                 error=str(e),
                 execution_time=execution_time
@@ -431,7 +438,7 @@ class BaseTool(ABC):
     
     async def cleanup(self):
         """Clean up tool resources."""
-        await self.logger.info(f"Cleaning up tool: {self.name}", tool_id=self.tool_id)
+        await self.logger.info("Cleaning up tool: %s", self.name, tool_id=self.tool_id)
         # Override in subclasses for specific cleanup 
 
     # ---------------------------------------------------------------------
@@ -546,14 +553,15 @@ class BaseTool(ABC):
         os.makedirs(dirs["inputs_dir"], exist_ok=True)
 
         task_id = context.get("task_id", "no_task")
-        timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        now = datetime.now()
+        timestamp_str = now.strftime("%Y%m%d_%H%M%S_%f")
         file_name = f"{timestamp_str}_{task_id}_inputs.json"
         file_path = dirs["inputs_dir"] / file_name
 
         payload = {
             "tool_id": self.tool_id,
             "tool_name": self.name,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "task_id": task_id,
             "parameters": self._safe_serialize(parameters),
             "context": self._safe_serialize(context or {}),
@@ -567,14 +575,15 @@ class BaseTool(ABC):
         os.makedirs(dirs["outputs_dir"], exist_ok=True)
 
         task_id = context.get("task_id", "no_task")
-        timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        now = datetime.now()
+        timestamp_str = now.strftime("%Y%m%d_%H%M%S_%f")
         file_name = f"{timestamp_str}_{task_id}_outputs.json"
         file_path = dirs["outputs_dir"] / file_name
 
         payload = {
             "tool_id": self.tool_id,
             "tool_name": self.name,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "task_id": task_id,
             "success": result.success,
             "result": self._safe_serialize(result.result),
@@ -13,6 +13,10 @@ from .base_tool import ToolCapability
 from ..logging.logger import get_logger
 
 
+# Words ignored when extracting keywords from task descriptions
+_COMMON_WORDS = frozenset({"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by"})
+
+
 class MappingStrategy(Enum):
     """Strategies for tool mapping."""
     EXACT_MATCH = "exact_match"
@@ -56,6 +60,10 @@ class ToolMapper:
         self.mapping_cache: Dict[str, TaskMapping] = {}
         self.logger = get_logger("ToolMapper")
         
+        # keyword -> tool_ids, built from tool metadata on first keyword lookup
+        self._keyword_index: Dict[str, List[str]] = {}
+        self._keyword_index_key: Optional[frozenset] = None
+        
     def map_task_to_tool(
         self,
         task_id: str,
@@ -178,22 +186,25 @@ class ToolMapper:
         # Extract keywords from task description
         keywords = self._extract_keywords(task_description.lower())
         
-        # Find tools that match keywords
+        # Count matches per tool through the inverted index
+        keyword_index = self._get_keyword_index()
+        match_counts: Dict[str, int] = {}
+        for keyword in keywords:
+            for tool_id in keyword_index.get(keyword, ()):
+                match_counts[tool_id] = match_counts.get(tool_id, 0) + 1
+        
+        # Find tools that match keywords (in registration order)
         for tool_id, tool_class in self.tool_registry._tool_classes.items():
-            tool_metadata = self._get_tool_metadata(tool_id)
-            if tool_metadata:
-                tool_keywords = tool_metadata.get("keywords", [])
-                matches = sum(1 for keyword in keywords if keyword in tool_keywords)
-                
-                if matches > 0:
-                    score = 5.0 + (matches * 1.0)  # Base score + bonus for matches
-                    candidates.append({
-                        "tool_id": tool_id,
-                        "tool_class": tool_class,
-                        "score": score,
-                        "strategy": MappingStrategy.KEYWORD_MATCH,
-                        "metadata": {"keyword_matches": matches}
-                    })
+            matches = match_counts.get(tool_id, 0)
+            if matches > 0:
+                score = 5.0 + (matches * 1.0)  # Base score + bonus for matches
+                candidates.append({
+                    "tool_id": tool_id,
+                    "tool_class": tool_class,
+                    "score": score,
+                    "strategy": MappingStrategy.KEYWORD_MATCH,
+                    "metadata": {"keyword_matches": matches}
+                })
         
         return candidates
     
@@ -217,11 +228,26 @@ class ToolMapper:
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract meaningful keywords from text."""
         # Simple keyword extraction - could be enhanced with NLP
-        common_words = {"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by"}
-        words = text.split()
-        keywords = [word for word in words if len(word) > 3 and word not in common_words]
+        keywords = [word for word in text.split() if len(word) > 3 and word not in _COMMON_WORDS]
         return keywords[:10]  # Limit to top 10 keywords
     
+    def _get_keyword_index(self) -> Dict[str, List[str]]:
+        """Get the keyword -> tool_ids index, rebuilding it when registrations changed."""
+        tool_classes = self.tool_registry._tool_classes
+        # Keyed on the (id, class) pairs, not the count, so an overwritten
+        # registration also triggers a rebuild
+        index_key = frozenset(tool_classes.items())
+        if self._keyword_index_key != index_key:
+            index: Dict[str, List[str]] = {}
+            for tool_id in tool_classes:
+                tool_metadata = self._get_tool_metadata(tool_id)
+                if tool_metadata:
+                    for keyword in set(tool_metadata.get("keywords", ())):
+                        index.setdefault(keyword, []).append(tool_id)
+            self._keyword_index = index
+            self._keyword_index_key = index_key
+        return self._keyword_index
+    
     def _get_tool_metadata(self, tool_id: str) -> Optional[Dict[str, Any]]:
         """Get metadata for a tool using the tool's get_metadata method."""
         if tool_id in self.tool_registry._tool_classes:
@@ -4,8 +4,10 @@ Tool Registry
 Manages and provides access to all available tools in the system.
 """
 
+import asyncio
 from typing import Dict, List, Any, Optional, Type
 from datetime import datetime
+from operator import itemgetter
 import uuid
 
 from .base_tool import BaseTool, ToolCapability
@@ -34,7 +36,7 @@ class ToolRegistry:
         self.logger = get_logger("ToolRegistry")
         
         # Use sync helper because we're in a non-async context
-        self.logger.info_sync(f"Initialized ToolRegistry instance: {id(self)}")
+        self.logger.info_sync("Initialized ToolRegistry instance: %s", id(self))
     
     def register_tool(self, tool: BaseTool) -> None:
         """
@@ -44,7 +46,7 @@ class ToolRegistry:
             tool: Tool instance to register
         """
         self._tools[tool.tool_id] = tool
-        self.logger.info_sync(f"Registered tool instance: {tool.name} ({tool.tool_id})")
+        self.logger.info_sync("Registered tool instance: %s (%s)", tool.name, tool.tool_id)
     
     def register_tool_class(self, name: str, tool_class: Type[BaseTool]) -> None:
         """
@@ -55,7 +57,7 @@ class ToolRegistry:
             tool_class: Tool class to register
         """
         self._tool_classes[name] = tool_class
-        self.logger.info_sync(f"Registered tool class: {name}")
+        self.logger.info_sync("Registered tool class: %s", name)
     
     def register_tool_with_metadata(self, tool_class: Type[BaseTool], metadata: Dict[str, Any] = None, config: Dict[str, Any] = None) -> str:
         """
@@ -85,7 +87,7 @@ class ToolRegistry:
         # Update indexes
         self._update_indexes(tool_id, metadata)
         
-        self.logger.info_sync(f"Registered tool: {metadata.get('name', 'Unknown')} (ID: {tool_id})")
+        self.logger.info_sync("Registered tool: %s (ID: %s)", metadata.get('name', 'Unknown'), tool_id)
         return tool_id
     
     def register_tool_class(self, tool_class: Type[BaseTool], config: Dict[str, Any] = None) -> str:
@@ -128,7 +130,7 @@ class ToolRegistry:
                 self._task_type_index[task_type] = []
             self._task_type_index[task_type].append(tool_id)
         
-        self.logger.info_sync(f"Indexes updated. Task type index now has: {list(self._task_type_index.keys())}")
+        self.logger.info_sync("Indexes updated. Task type index now has: %s", list(self._task_type_index))
     
     def get_tool(self, tool_id: str) -> Optional[BaseTool]:
         """
@@ -186,7 +188,7 @@ class ToolRegistry:
             Tool instance or None if not found
         """
         if tool_id not in self._tool_classes:
-            self.logger.error_sync(f"Tool ID {tool_id} not found in registry")
+            self.logger.error_sync("Tool ID %s not found in registry", tool_id)
             return None
         
         tool_class = self._tool_classes[tool_id]
@@ -194,7 +196,7 @@ class ToolRegistry:
         try:
             # Create instance
             instance_id = instance_id or f"{tool_id}_instance"
-            self.logger.info_sync(f"Creating tool instance: {tool_id} (ID: {instance_id})")
+            self.logger.info_sync("Creating tool instance: %s (ID: %s)", tool_id, instance_id)
             
             # Merge default config from registration with provided overrides
             default_cfg = self._tool_default_configs.get(tool_id, {})
@@ -205,11 +207,11 @@ class ToolRegistry:
                 config=merged_config
             )
             
-            self.logger.info_sync(f"Successfully created tool instance: {tool_id}")
+            self.logger.info_sync("Successfully created tool instance: %s", tool_id)
             return tool_instance
             
         except Exception as e:
-            self.logger.error_sync(f"Failed to create tool instance for {tool_id}: {e}")
+            self.logger.error_sync("Failed to create tool instance for %s: %s", tool_id, e)
             return None
     
     def get_all_tools(self) -> List[BaseTool]:
@@ -286,7 +288,7 @@ class ToolRegistry:
                 })
         
         # Sort by score (highest first)
-        candidates.sort(key=lambda x: -x["score"])
+        candidates.sort(key=itemgetter("score"), reverse=True)
         
         return candidates[:max_results]
     
@@ -349,7 +351,20 @@ class ToolRegistry:
     
     async def cleanup_all_instances(self):
         """Clean up all tool instances."""
-        for instance in self._tools.values():
-            await instance.cleanup()
+        # Instances are independent, so release them concurrently
+        instances = list(self._tools.values())
+        outcomes = await asyncio.gather(
+            *(instance.cleanup() for instance in instances),
+            return_exceptions=True
+        )
+        cancelled = None
+        for instance, outcome in zip(instances, outcomes):
+            if isinstance(outcome, asyncio.CancelledError):
+                cancelled = outcome
+            elif isinstance(outcome, BaseException):
+                self.logger.warning_sync("Cleanup failed for tool %s: %s", instance.tool_id, outcome)
+        if cancelled is not None:
+            # Not a completed cleanup; propagate instead of reporting success
+            raise cancelled
         self._tools.clear()
         self.logger.info_sync("Cleaned up all tool instances")
\ No newline at end of file